@@ -10,39 +10,37 @@ bl_info = {
 
 _needs_reload = "asset_forge" in locals()
 
-import bpy
+import importlib
 
-from . import config
+import bpy
 
-from .export import (
-    mesh_exporter,
-    mesh_metadata
-)
-from .validation import (
-    error_checks,
-    validate_asset,
-    warning_checks,
-    naming,
-    validation_types
-)
-from . import (
-    asset_forge
+# Submodules in dependency order; reload walks this list so re-enabling
+# the addon can't miss a module. Only config and asset_forge load at
+# startup — the export/validation stack is imported lazily on first
+# export.
+_SUBMODULE_NAMES = (
+    "config",
+    "validation.validation_types",
+    "validation.naming",
+    "validation.error_checks",
+    "validation.warning_checks",
+    "validation.validate_asset",
+    "export.mesh_metadata",
+    "export.mesh_exporter",
+    "asset_forge",
 )
 
 if _needs_reload:
-    import importlib
-    config = importlib.reload(config)
+    for _name in _SUBMODULE_NAMES:
+        importlib.reload(importlib.import_module(f".{_name}", __name__))
+
+from . import config
+from . import asset_forge
+
+if _needs_reload:
     config.reload_settings()
-    asset_forge = importlib.reload(asset_forge)
-    mesh_metadata = importlib.reload(mesh_metadata)
-    mesh_exporter = importlib.reload(mesh_exporter)
-    validate_asset = importlib.reload(validate_asset)
-    error_checks = importlib.reload(error_checks)
-    warning_checks = importlib.reload(warning_checks)
-    naming = importlib.reload(naming)
-    validation_types = importlib.reload(validation_types)
 
-classes = (asset_forge.AF_OT_export, asset_forge.AF_OT_reset_default, asset_forge.AF_PT_panel, asset_forge.AF_Settings, asset_forge.AF_PT_Settings, asset_forge.AF_PT_Naming, asset_forge.AF_PT_Budgets)
+classes = (asset_forge.AF_OT_export, asset_forge.AF_OT_export_batch, asset_forge.AF_OT_reset_default, asset_forge.AF_PT_panel, asset_forge.AF_Settings, asset_forge.AF_PT_Settings, asset_forge.AF_PT_Naming, asset_forge.AF_PT_Budgets)
 
 def register():
     for cls in classes:
@@ -53,6 +51,13 @@ def register():
 
 def unregister():
     del bpy.types.Scene.af # type: ignore
-    
+
+    # mesh_metadata registers cache-invalidation handlers when it's
+    # lazily imported; remove them by name so disabling the addon
+    # doesn't have to import the module just to clean up.
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+        for handler in [h for h in handlers if getattr(h, "__name__", "") == "_af_clear_stats_cache"]:
+            handlers.remove(handler)
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -1,27 +1,91 @@
 import os
 import bpy
-import subprocess
-import json
+import threading
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 
 from bpy import types as bt
 from typing import Any
 from pathlib import Path
 from sys import platform
 
-from .export import mesh_exporter, mesh_metadata
-from .validation import validate_asset
 from . import config
 
 
+# Property name -> (config key path, shipped fallback). One table
+# shared by the settings defaults and the reset operator so the key
+# paths can't drift apart.
+_CONFIG_BACKED_PROPS: dict[str, tuple[str, Any]] = {
+    "mesh_prefix": ("naming_conventions.mesh_prefix", "SM_"),
+    "texture_prefix": ("naming_conventions.texture_prefix", "T_"),
+    "material_prefix": ("naming_conventions.material_prefix", "M_"),
+    "material_instance_prefix": ("naming_conventions.material_instance_prefix", "MI_"),
+    "prop_small_tri_budget": ("asset_budgets.PROP_SMALL.max_triangles", 5000),
+    "prop_small_tex_budget": ("asset_budgets.PROP_SMALL.max_texture_size", 2048),
+    "prop_hero_tri_budget": ("asset_budgets.HERO_PROP.max_triangles", 50000),
+    "prop_hero_tex_budget": ("asset_budgets.HERO_PROP.max_texture_size", 4096),
+    "prop_modular_tri_budget": ("asset_budgets.MODULAR.max_triangles", 2000),
+    "prop_modular_tex_budget": ("asset_budgets.MODULAR.max_texture_size", 2048),
+}
+
+# Property defaults pulled from config once at import time instead of
+# one lookup per property during class-body evaluation.
+_SETTING_DEFAULTS: dict[str, Any] = {
+    key_path: config.get_setting(key_path, fallback)
+    for key_path, fallback in _CONFIG_BACKED_PROPS.values()
+}
+
+
 def update_export_dir(self, context):
     if self.export_dir:
-        self.export_dir = bpy.path.abspath(self.export_dir)
+        abs_dir = bpy.path.abspath(self.export_dir)
+        if abs_dir != self.export_dir:
+            # Item write bypasses the update callback, so normalizing
+            # the value doesn't re-enter this function or fire a second
+            # notifier cycle.
+            self["export_dir"] = abs_dir
+    # Resolved once at edit time so exports don't re-run '//' expansion.
+    self.export_dir_abs = self.export_dir
+
+
+def update_ue_project_path(self, context):
+    # Same edit-time resolution as update_export_dir.
+    self.ue_project_path_abs = bpy.path.abspath(self.ue_project_path) if self.ue_project_path else ""
+
+
+def update_ue_assets_dir(self, context):
+    # Derived /Game/... strings rebuilt only when their inputs change,
+    # not on every export.
+    self.ue_assets_dir_cached = f"/Game/{self.assets_dir}"
+
+
+def update_ue_master_mat(self, context):
+    if self.ue_master_material:
+        self.ue_master_mat_path_cached = f"/Game/{self.materials_dir}/{self.ue_master_material}"
+    else:
+        self.ue_master_mat_path_cached = ""
+
+
+# Config writes coalesced across keystrokes; flushed shortly after the
+# last edit so typing a prefix costs one settings.json rewrite instead
+# of one per character.
+_pending_settings: dict[str, Any] = {}
+
+
+def _flush_pending_settings() -> None:
+    updates = dict(_pending_settings)
+    _pending_settings.clear()
+    config.save_settings(updates)
+    # One-shot: returning None unregisters the timer.
+    return None
 
 
 def make_setting_updater(key_path: str, property_name: str):
     def update_func(self, context):
-        value = getattr(self, property_name)
-        config.save_setting(key_path, value)
+        _pending_settings[key_path] = getattr(self, property_name)
+        if not bpy.app.timers.is_registered(_flush_pending_settings):
+            bpy.app.timers.register(_flush_pending_settings, first_interval=0.3)
     return update_func
 
 
@@ -36,11 +100,26 @@ class AF_Settings(bt.PropertyGroup):
         update=update_export_dir
     ) # type: ignore
 
+    export_dir_abs: bpy.props.StringProperty(
+        name="Export Folder (Resolved)",
+        description="Absolute export folder cached when Export Folder is edited.",
+        default="",
+        options={"HIDDEN"}
+    ) # type: ignore
+
     ue_project_path: bpy.props.StringProperty(
         name="UE Project File",
         description="Unreal Project you want to export the asset to.",
         subtype="FILE_PATH",
         default="",
+        update=update_ue_project_path
+    ) # type: ignore
+
+    ue_project_path_abs: bpy.props.StringProperty(
+        name="UE Project File (Resolved)",
+        description="Absolute project path cached when UE Project File is edited.",
+        default="",
+        options={"HIDDEN"}
     ) # type: ignore
     
     export_ext: bpy.props.EnumProperty(
@@ -53,22 +132,50 @@ class AF_Settings(bt.PropertyGroup):
         default="fbx"
     ) # type: ignore
 
+    export_scope: bpy.props.EnumProperty(
+        name="Export Scope",
+        description="Choose which files get written on export.",
+        items=[
+            ("ALL", "Mesh and Metadata", "Export the mesh file and its JSON manifest"),
+            ("METADATA_ONLY", "Metadata Only", "Refresh only the JSON manifest without re-exporting the mesh"),
+            ("FBX_ONLY", "Mesh Only", "Export only the mesh file without refreshing the JSON manifest")
+        ],
+        default="ALL"
+    ) # type: ignore
+
     ue_master_material: bpy.props.StringProperty(
         name="Master Material",
         description="Unreal master material you want to instance.\nLeave blank if you do not want to instance a material.",
         default="",
+        update=update_ue_master_mat
     ) # type: ignore
 
     materials_dir: bpy.props.StringProperty(
         name="Materials Folder",
         description="The folder in your Unreal Engine project where materials are stored.",
-        default="Materials"
+        default="Materials",
+        update=update_ue_master_mat
     ) # type: ignore
 
     assets_dir: bpy.props.StringProperty(
         name="Assets Folder",
         description="The folder in your Unreal Engine project where assets are stored.",
-        default="Assets"
+        default="Assets",
+        update=update_ue_assets_dir
+    ) # type: ignore
+
+    ue_assets_dir_cached: bpy.props.StringProperty(
+        name="UE Assets Path (Derived)",
+        description="Cached /Game/... assets path rebuilt when Assets Folder changes.",
+        default="",
+        options={"HIDDEN"}
+    ) # type: ignore
+
+    ue_master_mat_path_cached: bpy.props.StringProperty(
+        name="UE Master Material Path (Derived)",
+        description="Cached /Game/... master material path rebuilt when its inputs change.",
+        default="",
+        options={"HIDDEN"}
     ) # type: ignore
 
     asset_type: bpy.props.EnumProperty(
@@ -82,6 +189,12 @@ class AF_Settings(bt.PropertyGroup):
         default="PROP_SMALL"
     ) # type: ignore
 
+    fail_fast: bpy.props.BoolProperty(
+        name="Fail Fast",
+        description="Validate before writing any files and abort the export when the asset would be refused by the configured import strictness.",
+        default=True
+    ) # type: ignore
+
     import_strictness: bpy.props.EnumProperty(
         name="Import Strictness",
         description="How strict validation should be to import into Unreal Editor.",
@@ -96,117 +209,175 @@ class AF_Settings(bt.PropertyGroup):
     mesh_prefix: bpy.props.StringProperty(
         name="Mesh Prefix",
         description="Prefix used to denote static mesh assets.",
-        default=config.get_setting("naming_conventions.mesh_prefix", "SM_"),
+        default=_SETTING_DEFAULTS["naming_conventions.mesh_prefix"],
         update=make_setting_updater("naming_conventions.mesh_prefix", "mesh_prefix")
     ) # type: ignore
 
     texture_prefix: bpy.props.StringProperty(
         name="Texture Prefix",
         description="Prefix used to denote image texture files.",
-        default=config.get_setting("naming_conventions.texture_prefix", "T_"),
+        default=_SETTING_DEFAULTS["naming_conventions.texture_prefix"],
         update=make_setting_updater("naming_conventions.texture_prefix", "texture_prefix")
     ) # type: ignore
 
     material_prefix: bpy.props.StringProperty(
         name="Master Material Prefix",
         description="Prefix used to denote master materials.",
-        default=config.get_setting("naming_conventions.material_prefix", "M_"),
+        default=_SETTING_DEFAULTS["naming_conventions.material_prefix"],
         update=make_setting_updater("naming_conventions.material_prefix", "material_prefix")
     ) # type: ignore
 
     material_instance_prefix: bpy.props.StringProperty(
         name="Material Instance Prefix",
         description="Prefix used to denote material instances.",
-        default=config.get_setting("naming_conventions.material_instance_prefix", "MI_"),
+        default=_SETTING_DEFAULTS["naming_conventions.material_instance_prefix"],
         update=make_setting_updater("naming_conventions.material_instance_prefix", "material_instance_prefix")
     ) # type: ignore
     
     prop_small_tri_budget: bpy.props.IntProperty(
         name="Triangle Budget",
         description="Triangle budget for small props.",
-        default=config.get_setting("asset_budgets.PROP_SMALL.max_triangles", 5000),
+        default=_SETTING_DEFAULTS["asset_budgets.PROP_SMALL.max_triangles"],
         update=make_setting_updater("asset_budgets.PROP_SMALL.max_triangles", "prop_small_tri_budget")
     ) # type: ignore
 
     prop_small_tex_budget: bpy.props.IntProperty(
         name="Tex Budget (px)",
         description="Image texture budget for small props.",
-        default=config.get_setting("asset_budgets.PROP_SMALL.max_texture_size", 2048),
+        default=_SETTING_DEFAULTS["asset_budgets.PROP_SMALL.max_texture_size"],
         update=make_setting_updater("asset_budgets.PROP_SMALL.max_texture_size", "prop_small_tex_budget")
     ) # type: ignore
     
     prop_hero_tri_budget: bpy.props.IntProperty(
         name="Triangle Budget",
         description="Triangle budget for hero props.",
-        default=config.get_setting("asset_budgets.HERO_PROP.max_triangles", 5000),
+        default=_SETTING_DEFAULTS["asset_budgets.HERO_PROP.max_triangles"],
         update=make_setting_updater("asset_budgets.HERO_PROP.max_triangles", "prop_hero_tri_budget")
     ) # type: ignore
     
     prop_hero_tex_budget: bpy.props.IntProperty(
         name="Tex Budget (px)",
         description="Image texture budget for hero props.",
-        default=config.get_setting("asset_budgets.HERO_PROP.max_texture_size", 4096),
+        default=_SETTING_DEFAULTS["asset_budgets.HERO_PROP.max_texture_size"],
         update=make_setting_updater("asset_budgets.HERO_PROP.max_texture_size", "prop_hero_tex_budget")
     ) # type: ignore
     
     prop_modular_tri_budget: bpy.props.IntProperty(
         name="Triangle Budget",
         description="Triangle budget for modular props.",
-        default=config.get_setting("asset_budgets.MODULAR.max_triangles", 5000),
+        default=_SETTING_DEFAULTS["asset_budgets.MODULAR.max_triangles"],
         update=make_setting_updater("asset_budgets.MODULAR.max_triangles", "prop_modular_tri_budget")
     ) # type: ignore
 
     prop_modular_tex_budget: bpy.props.IntProperty(
         name="Tex Budget (px)",
         description="Image texture budget for modular props.",
-        default=config.get_setting("asset_budgets.MODULAR.max_texture_size", 2048),
+        default=_SETTING_DEFAULTS["asset_budgets.MODULAR.max_texture_size"],
         update=make_setting_updater("asset_budgets.MODULAR.max_texture_size", "prop_modular_tex_budget")
     ) # type: ignore
     
     pass
 
 
-def ensure_active_mesh_object() -> bt.Object:
-    obj = bpy.context.active_object
+def deselect_all(context: bt.Context) -> None:
+    """Deselect every selected object with direct RNA writes.
+
+    Avoids the bpy.ops.object.select_all operator, which pays for a poll,
+    undo push, and notifier dispatch on every call.
+    """
+
+    for o in context.selected_objects:
+        o.select_set(False)
+
+
+def ensure_active_mesh_object(context: bt.Context) -> bt.Object:
+    obj = context.active_object
 
     if obj is None or obj.type != "MESH":
         raise RuntimeError("Please select a mesh to export.")
 
-    bpy.ops.object.select_all(action="DESELECT")
+    deselect_all(context)
     obj.select_set(True)
-    
-    view_layer = bpy.context.view_layer
+
+    view_layer = context.view_layer
     assert view_layer is not None
     view_layer.objects.active = obj
 
     return obj
 
 
-def _get_ue_path() -> str:
-    platform_map = {
-        "linux": "linux",
-        "linux2": "linux",
-        "win32": "windows",
-        "darwin": "darwin"
-    }
+# Resolved once: resolve() stats every path component, and the engine
+# scripts don't move while Blender is running.
+_ENGINE_DIR = Path(__file__).resolve().parent / "engine"
+_ENGINE_SCRIPT = str(_ENGINE_DIR / "ue_import.py")
+_DAEMON_SCRIPT = str(_ENGINE_DIR / "ue_daemon.py")
 
-    platform_key = platform_map.get(platform, "")
+_PLATFORM_MAP = {
+    "linux": "linux",
+    "linux2": "linux",
+    "win32": "windows",
+    "darwin": "darwin"
+}
+
+
+# lru_cache instead of a module constant so a config hot-reload can
+# invalidate via _get_ue_path.cache_clear().
+@lru_cache(maxsize=1)
+def _get_ue_path() -> str:
+    platform_key = _PLATFORM_MAP.get(platform, "")
     return config.get_setting(f"unreal_engine.paths.{platform_key}", "")
 
 
-def run_ue_import(obj_name: str, context: bt.Context) -> None:
+# One shared /dev/null descriptor for child stdout/stderr instead of
+# subprocess opening and closing it twice per launch. Opened lazily so
+# importing the module costs no fd.
+@lru_cache(maxsize=1)
+def _devnull_fd() -> int:
+    fd = os.open(os.devnull, os.O_RDWR)
+    os.set_inheritable(fd, True)
+    return fd
+
+
+def _send_to_ue_daemon(manifest_path: str, port: int) -> bool:
+    """Push a manifest path to a running editor daemon. Returns False when
+    no daemon is listening so the caller can fall back to a cold launch.
+    """
+
+    import socket
+
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5) as s:
+            s.sendall(manifest_path.encode() + b"\n")
+    except OSError:
+        return False
+
+    return True
+
+
+def run_ue_import(manifest_path: str, context: bt.Context) -> None:
+    # Deferred so enabling the addon doesn't pay for the import; the
+    # module is cached in sys.modules after the first export.
+    import subprocess
+
     settings: AF_Settings = context.scene.af # type: ignore
 
-    p = Path(__file__).resolve().parent
-    engine_script = str(p / "engine" / "ue_import.py")
-    export_dir: str = bpy.path.abspath(settings.export_dir)
-    project_path: str = bpy.path.abspath(settings.ue_project_path)
-    manifest_path: str = os.path.join(export_dir, f"{obj_name}.json")
+    # With a daemon port configured, a warm editor ingests the manifest
+    # over a socket and the multi-second startup is paid only once. The
+    # first export (or a dead daemon) falls through to a launch that
+    # starts the daemon with this manifest on board.
+    daemon_port: int = config.get_setting("unreal_engine.daemon_port", 0)
+    if daemon_port and _send_to_ue_daemon(manifest_path, daemon_port):
+        return
+
+    engine_script = _DAEMON_SCRIPT if daemon_port else _ENGINE_SCRIPT
+    project_path: str = settings.ue_project_path_abs or bpy.path.abspath(settings.ue_project_path)
 
     kwargs: dict[str, Any] = {
-        "stdout": subprocess.DEVNULL,
-        "stderr": subprocess.DEVNULL,
-        "env": os.environ.copy(),
+        "stdout": _devnull_fd(),
+        "stderr": _devnull_fd(),
+        # env=None inherits the environment without the per-launch dict
+        # copy; subprocess never mutates it.
+        "env": None,
     }
     if platform == "win32":
         DETACHED_PROCESS = 0x00000008
@@ -217,15 +388,139 @@ def run_ue_import(obj_name: str, context: bt.Context) -> None:
         kwargs["close_fds"] = True
 
 
-    subprocess.Popen([
+    argv: list[str] = [
         _get_ue_path(),
         f"{project_path}",
         f"-ExecutePythonScript={engine_script}",
         f"-manifest={manifest_path}",
-        "-unattended -nop4 -nosplash -stdout -FullStdOutLogOutput -log"
-        ],
-        **kwargs
+    ]
+    if daemon_port:
+        # The daemon keeps the editor alive listening for later
+        # manifests, so it can't run unattended.
+        argv.append(f"-daemonport={daemon_port}")
+        argv.append("-nop4 -nosplash -stdout -FullStdOutLogOutput -log")
+    else:
+        argv.append("-unattended -nop4 -nosplash -stdout -FullStdOutLogOutput -log")
+
+    subprocess.Popen(argv, **kwargs)
+
+
+def export_object(obj: bt.Object, context: bt.Context, settings: "AF_Settings",
+                  export_dir: str, ue_project_path: str,
+                  io_executor: Executor | None = None,
+                  export_timestamp: str | None = None) -> dict[str, Any]:
+    """Generate metadata and validation for one mesh object and write its
+    FBX/OBJ and JSON manifest to the export directory.
+
+    Batch callers pass export_timestamp so every manifest in the batch
+    carries the same sampled time.
+    """
+
+    # Deferred like subprocess in run_ue_import: registering the addon
+    # shouldn't pull the export/validation stack (numpy included) until
+    # the first export actually needs it.
+    from .export import mesh_exporter, mesh_metadata
+    from .validation import validate_asset
+
+    object_export_path: str = os.path.join(export_dir, f"{obj.name}.fbx")
+    data_export_path: str = os.path.join(export_dir, f"{obj.name}.json")
+
+    ue_assets_dir: str = settings.ue_assets_dir_cached or f"/Game/{settings.assets_dir}"
+    master_mat_path: str = settings.ue_master_mat_path_cached
+    if not master_mat_path and settings.ue_master_material != "":
+        master_mat_path = f"/Game/{settings.materials_dir}/{settings.ue_master_material}"
+
+    content_hash: str = mesh_exporter.mesh_content_hash(obj)
+
+    validation: dict[str, Any] = validate_asset.generate_validation_data(obj, settings.asset_type, content_hash)
+
+    # With Fail Fast on, a refusal surfaces before any file is written,
+    # so a failing asset never pays the FBX serialization it would not
+    # get to import anyway.
+    if settings.fail_fast:
+        check_import_allowed({"validation": validation}, settings)
+
+    mesh_data: dict[str, Any] = mesh_metadata.generate_metadata(obj, export_dir, ue_project_path, ue_assets_dir, master_mat_path, settings.asset_type, settings.export_ext, context, export_timestamp)
+    mesh_data["validation"] = validation
+
+    normalized_name: str = mesh_data["source"]["normalized_name"]
+    final_mesh_path: str = os.path.join(export_dir, f"{normalized_name}.{settings.export_ext}")
+    skip_fbx: bool = (
+        settings.export_scope == "METADATA_ONLY"
+        or mesh_exporter.is_mesh_cached(export_dir, normalized_name, content_hash, final_mesh_path)
     )
+    write_metadata: bool = settings.export_scope != "FBX_ONLY"
+
+    # The manifest write is pure file I/O on an already-materialized dict,
+    # so it can overlap the FBX export. The worker never touches bpy data.
+    # Batch exports pass a shared executor so threads are reused across
+    # objects instead of spawned per export.
+    metadata_future = None
+    metadata_thread: threading.Thread | None = None
+    if write_metadata:
+        if io_executor is not None:
+            metadata_future = io_executor.submit(mesh_exporter.export_mesh_metadata, data_export_path, mesh_data)
+        else:
+            metadata_thread = threading.Thread(
+                target=mesh_exporter.export_mesh_metadata,
+                args=(data_export_path, mesh_data)
+            )
+            metadata_thread.start()
+    try:
+        if not skip_fbx:
+            mesh_exporter.export_active_mesh_fbx(object_export_path, settings.export_ext)
+    finally:
+        if metadata_future is not None:
+            metadata_future.result()
+        elif metadata_thread is not None:
+            metadata_thread.join()
+
+    if obj.name != normalized_name:
+        # os.replace is atomic and doesn't fail on Windows when a stale
+        # file from a previous export is still at the destination.
+        if not skip_fbx:
+            os.replace(object_export_path, final_mesh_path)
+        if write_metadata:
+            os.replace(data_export_path, os.path.join(export_dir, f"{normalized_name}.json"))
+
+    if not skip_fbx:
+        mesh_exporter.record_mesh_hash(export_dir, normalized_name, content_hash)
+
+    return mesh_data
+
+
+def check_import_allowed(mesh_data: dict[str, Any], settings: "AF_Settings") -> bool:
+    """Return False when settings disable the engine import entirely;
+    raise when validation results block it under the configured
+    import strictness.
+    """
+
+    if settings.import_strictness == "DO_NOT_IMPORT":
+        return False
+    if settings.export_scope == "FBX_ONLY":
+        # No manifest was written, so there is nothing for the engine
+        # script to ingest.
+        return False
+    if settings.import_strictness == "ERRORS_AND_WARNINGS" and (mesh_data['validation']['warnings'] != [] or not mesh_data['validation']['passed']):
+        raise RuntimeError(f"Asset failed validation checks. Errors: {mesh_data['validation']['errors']}. Warnings: {mesh_data['validation']['warnings']}")
+    if not mesh_data['validation']['passed']:
+        raise RuntimeError(f"Asset failed validation checks. Errors: {mesh_data['validation']['errors']}")
+
+    return True
+
+
+def maybe_run_ue_import(mesh_data: dict[str, Any], settings: "AF_Settings", context: bt.Context) -> None:
+    """Send the exported asset to Unreal Editor if validation results allow
+    it under the configured import strictness.
+    """
+
+    if not check_import_allowed(mesh_data, settings):
+        return
+
+    export_dir: str = settings.export_dir_abs or bpy.path.abspath(settings.export_dir)
+    # export_dir is already absolute, so one f-string beats the join walk.
+    manifest_path: str = f"{export_dir}{os.sep}{mesh_data['source']['normalized_name']}.json"
+    run_ue_import(manifest_path, context)
 
 
 class AF_OT_export(bt.Operator):
@@ -234,42 +529,80 @@ class AF_OT_export(bt.Operator):
     bl_options: set = {"REGISTER", "UNDO"}
 
     def execute(self, context: bt.Context):
-        settings: AF_Settings = context.scene.af # type: ignore
-        export_dir: str = bpy.path.abspath(settings.export_dir)
-        ue_project_path: str = bpy.path.abspath(settings.ue_project_path)
+        from .export import mesh_exporter
 
-        obj: bt.Object = ensure_active_mesh_object()
-        filename: str = f"{obj.name}.fbx"
-        object_export_path: str = os.path.join(export_dir, filename)
-
-        obj_data: str = f"{obj.name}.json"
-        data_export_path: str = os.path.join(export_dir, obj_data)
-
-        ue_assets_dir: str = f"/Game/{settings.assets_dir}"
-        master_mat_path: str = ""
-        if settings.ue_master_material != "":
-            master_mat_path = f"/Game/{settings.materials_dir}/{settings.ue_master_material}"
+        settings: AF_Settings = context.scene.af # type: ignore
+        export_dir: str = settings.export_dir_abs or bpy.path.abspath(settings.export_dir)
+        ue_project_path: str = settings.ue_project_path_abs or bpy.path.abspath(settings.ue_project_path)
 
-        mesh_data: dict[str, Any] = mesh_metadata.generate_metadata(obj, export_dir, ue_project_path, ue_assets_dir, master_mat_path, settings.asset_type, settings.export_ext, bpy.context)
-        mesh_data["validation"] = validate_asset.generate_validation_data(obj, settings.asset_type)
+        obj: bt.Object = ensure_active_mesh_object(context)
+        mesh_exporter.ensure_export_dir(export_dir)
 
         try:
-            mesh_exporter.export_mesh_metadata(data_export_path, mesh_data)
-            mesh_exporter.export_active_mesh_fbx(object_export_path, mesh_data, settings.export_ext)
-
-            if settings.import_strictness == "DO_NOT_IMPORT":
-                pass
-            elif settings.import_strictness == "ERRORS_AND_WARNINGS" and (mesh_data['validation']['warnings'] != [] or not mesh_data['validation']['passed']):
-                raise RuntimeError(f"Asset failed validation checks. Errors: {mesh_data['validation']['errors']}. Warnings: {mesh_data['validation']['warnings']}")
-            elif not mesh_data['validation']['passed']:
-                raise RuntimeError(f"Asset failed validation checks. Errors: {mesh_data['validation']['errors']}")
-            else:
-                run_ue_import(mesh_data["source"]["normalized_name"], context)
+            mesh_data: dict[str, Any] = export_object(obj, context, settings, export_dir, ue_project_path)
+            maybe_run_ue_import(mesh_data, settings, context)
         except Exception as e:
             self.report({"ERROR"}, str(e))
             return {"CANCELLED"}
-    
-        self.report({"INFO"}, f"Exported: {object_export_path}")
+
+        self.report({"INFO"}, f"Exported: {os.path.join(export_dir, obj.name)}")
+        return {"FINISHED"}
+
+
+class AF_OT_export_batch(bt.Operator):
+    bl_idname: str  = "af.export_batch"
+    bl_label: str   = "Export Selected Meshes"
+    bl_options: set = {"REGISTER", "UNDO"}
+
+    def execute(self, context: bt.Context):
+        from .export import mesh_exporter, mesh_metadata
+
+        settings: AF_Settings = context.scene.af # type: ignore
+        export_dir: str = settings.export_dir_abs or bpy.path.abspath(settings.export_dir)
+        ue_project_path: str = settings.ue_project_path_abs or bpy.path.abspath(settings.ue_project_path)
+
+        meshes: list[bt.Object] = [o for o in context.selected_objects if o.type == "MESH"]
+        if not meshes:
+            self.report({"ERROR"}, "Please select one or more meshes to export.")
+            return {"CANCELLED"}
+
+        mesh_exporter.ensure_export_dir(export_dir)
+
+        view_layer = context.view_layer
+        assert view_layer is not None
+        deselect_all(context)
+
+        exported: int = 0
+        to_import: list[dict[str, Any]] = []
+        batch_timestamp = mesh_metadata._utc_timestamp()
+        with ThreadPoolExecutor(max_workers=4) as io_executor:
+            for obj in meshes:
+                obj.select_set(True)
+                view_layer.objects.active = obj
+
+                try:
+                    mesh_data: dict[str, Any] = export_object(obj, context, settings, export_dir, ue_project_path, io_executor,
+                                                              export_timestamp=batch_timestamp)
+                    if check_import_allowed(mesh_data, settings):
+                        to_import.append(mesh_data)
+                    exported += 1
+                except Exception as e:
+                    self.report({"WARNING"}, f"{obj.name}: {e}")
+                finally:
+                    obj.select_set(False)
+
+        if exported == 0:
+            self.report({"ERROR"}, "No meshes were exported.")
+            return {"CANCELLED"}
+
+        # One combined manifest and one editor launch for the whole batch,
+        # so UE startup is paid once instead of per asset.
+        if to_import:
+            batch_manifest_path: str = os.path.join(export_dir, "af_batch.json")
+            mesh_exporter.export_mesh_metadata(batch_manifest_path, to_import)
+            run_ue_import(batch_manifest_path, context)
+
+        self.report({"INFO"}, f"Exported {exported} of {len(meshes)} meshes to: {export_dir}")
         return {"FINISHED"}
 
 
@@ -283,18 +616,9 @@ class AF_OT_reset_default(bt.Operator):
 
         try:
             config.reset_default()
-            
-            settings.mesh_prefix = config.get_setting("naming_conventions.mesh_prefix", "SM_")
-            settings.texture_prefix = config.get_setting("naming_conventions.texture_prefix", "T_")
-            settings.material_prefix = config.get_setting("naming_conventions.material_prefix", "M_")
-            settings.material_instance_prefix = config.get_setting("naming_conventions.material_instance_prefix", "MI_")
-
-            settings.prop_small_tri_budget = config.get_setting("asset_budgets.prop_small_tri_budget", 5000)
-            settings.prop_small_tex_budget = config.get_setting("asset_budgets.prop_small_tex_budget", 2048)
-            settings.prop_hero_tri_budget = config.get_setting("asset_budgets.prop_hero_tri_budget", 50000)
-            settings.prop_hero_tex_budget = config.get_setting("asset_budgets.prop_hero_tex_budget", 4096)
-            settings.prop_modular_tri_budget = config.get_setting("asset_budgets.prop_modular_tri_budget", 2000)
-            settings.prop_modular_tex_budget = config.get_setting("asset_budgets.prop_modular_tex_budget", 2048)
+
+            for prop_name, (key_path, fallback) in _CONFIG_BACKED_PROPS.items():
+                setattr(settings, prop_name, config.get_setting(key_path, fallback))
         except Exception as e:
             self.report({"ERROR"}, str(e))
             return {"CANCELLED"}
@@ -304,6 +628,18 @@ class AF_OT_reset_default(bt.Operator):
 
 
 
+# Redraw-hot panels iterate these module tuples instead of re-evaluating
+# one layout call per line in draw() bodies rebuilt every frame.
+_MAIN_PANEL_PROPS = ("asset_type", "export_ext", "export_scope", "export_dir")
+_UE_PANEL_PROPS = ("ue_project_path", "ue_master_material")
+_NAMING_PANEL_PROPS = ("mesh_prefix", "texture_prefix", "material_prefix", "material_instance_prefix")
+_BUDGET_PANEL_GROUPS = (
+    ("Small Prop", ("prop_small_tri_budget", "prop_small_tex_budget")),
+    ("Hero Prop", ("prop_hero_tri_budget", "prop_hero_tex_budget")),
+    ("Modular Prop", ("prop_modular_tri_budget", "prop_modular_tex_budget")),
+)
+
+
 class AF_PT_panel(bt.Panel):
     bl_label       = "Asset Forge"
     bl_idname      = "AF_PT_panel"
@@ -321,15 +657,15 @@ class AF_PT_panel(bt.Panel):
         layout.use_property_split = True
         layout.use_property_decorate = True
 
-        layout.prop(settings, "asset_type")
-        layout.prop(settings, "export_ext")
-        layout.prop(settings, "export_dir")
+        for prop in _MAIN_PANEL_PROPS:
+            layout.prop(settings, prop)
         layout.separator()
         layout.label(text="Unreal Engine Info:")
-        layout.prop(settings, "ue_project_path")
-        layout.prop(settings, "ue_master_material")
+        for prop in _UE_PANEL_PROPS:
+            layout.prop(settings, prop)
         layout.separator()
         layout.operator("af.export", text="Export Asset")
+        layout.operator("af.export_batch", text="Export Selected Assets")
 
         
 class AF_PT_Settings(bt.Panel):
@@ -354,6 +690,7 @@ class AF_PT_Settings(bt.Panel):
         layout.prop(settings, "materials_dir")
         layout.separator()
         layout.prop(settings, "import_strictness")
+        layout.prop(settings, "fail_fast")
         layout.separator()
         layout.operator("af.reset_default", text="Reset Settings")
 
@@ -376,10 +713,8 @@ class AF_PT_Naming(bt.Panel):
         layout.use_property_split = True
         layout.use_property_decorate = True
 
-        layout.prop(settings, "mesh_prefix")
-        layout.prop(settings, "texture_prefix")
-        layout.prop(settings, "material_prefix")
-        layout.prop(settings, "material_instance_prefix")
+        for prop in _NAMING_PANEL_PROPS:
+            layout.prop(settings, prop)
 
 
 class AF_PT_Budgets(bt.Panel):
@@ -400,12 +735,7 @@ class AF_PT_Budgets(bt.Panel):
         layout.use_property_split = True
         layout.use_property_decorate = True
 
-        layout.label(text="Small Prop")
-        layout.prop(settings, "prop_small_tri_budget")
-        layout.prop(settings, "prop_small_tex_budget")
-        layout.label(text="Hero Prop")
-        layout.prop(settings, "prop_hero_tri_budget")
-        layout.prop(settings, "prop_hero_tex_budget")
-        layout.label(text="Modular Prop")
-        layout.prop(settings, "prop_modular_tri_budget")
-        layout.prop(settings, "prop_modular_tex_budget")
+        for label, props in _BUDGET_PANEL_GROUPS:
+            layout.label(text=label)
+            for prop in props:
+                layout.prop(settings, prop)
@@ -3,8 +3,30 @@ import json
 from pathlib import Path
 from typing import Any
 
+# orjson parses and serializes in C; fall back to the stdlib when the
+# wheel isn't bundled.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _settings_cache: dict[str, Any] | None = None
 
+# Flat mirror of the settings tree keyed by full dotted path, so
+# get_setting is a single dict.get instead of a split plus walk.
+_flat_cache: dict[str, Any] = {}
+
+_MISSING = object()
+
+
+def _flatten(tree: dict[str, Any], prefix: str = "") -> None:
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        _flat_cache[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.")
+
+
 def load_settings() -> dict[str, Any]:
     """Load settings from config/settings.json. Caches the result for subsequent calls."""
     global _settings_cache
@@ -17,11 +39,17 @@ def load_settings() -> dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Settings file not found at {config_path}")
 
-    with open(config_path, "r") as f:
-        _settings_cache = json.load(f)
+    if orjson is not None:
+        _settings_cache = orjson.loads(config_path.read_bytes())
+    else:
+        with open(config_path, "r") as f:
+            _settings_cache = json.load(f)
 
     assert _settings_cache is not None
 
+    _flat_cache.clear()
+    _flatten(_settings_cache)
+
     return _settings_cache
 
 
@@ -31,17 +59,8 @@ def get_setting(key_path: str, default: Any = None) -> Any:
     Example: 'unreal_engine.version'
     """
 
-    settings = load_settings()
-    keys = key_path.split(".")
-
-    value = settings
-    for k in keys:
-        if isinstance(value, dict) and k in value:
-            value = value[k]
-        else:
-            return default
-
-    return value
+    load_settings()
+    return _flat_cache.get(key_path, default)
 
 
 def reload_settings() -> None:
@@ -49,18 +68,11 @@ def reload_settings() -> None:
 
     global _settings_cache
     _settings_cache = None
+    _flat_cache.clear()
     load_settings()
 
 
-def save_setting(key_path: str, value: Any) -> None:
-    """Save a setting using dot notation and persist to settings.json.
-
-    Example: save_setting('naming_conventions.mesh_prefix', 'SM_')
-    """
-
-    global _settings_cache
-
-    settings = load_settings()
+def _set_nested(settings: dict[str, Any], key_path: str, value: Any) -> None:
     keys = key_path.split(".")
 
     current = settings
@@ -75,15 +87,60 @@ def save_setting(key_path: str, value: Any) -> None:
 
     current[keys[-1]] = value
 
+
+def _write_settings(settings: dict[str, Any]) -> None:
     config_path = Path(__file__).parent / "settings.json"
     temp_path = config_path.with_suffix('.tmp')
 
-    with open(temp_path, 'w') as f:
-        json.dump(settings, f, indent=2)
+    if orjson is not None:
+        temp_path.write_bytes(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+    else:
+        with open(temp_path, 'w') as f:
+            json.dump(settings, f, indent=2)
 
     temp_path.replace(config_path)
 
-    _settings_cache = settings
+
+def save_settings(updates: dict[str, Any]) -> None:
+    """Apply several dotted-path updates and persist them in one write.
+
+    Example: save_settings({'naming_conventions.mesh_prefix': 'SM_'})
+    """
+
+    if not updates:
+        return
+
+    settings = load_settings()
+
+    # Drop no-op updates so a callback firing with the stored value
+    # doesn't trigger a disk write.
+    updates = {
+        key_path: value
+        for key_path, value in updates.items()
+        if _flat_cache.get(key_path, _MISSING) != value
+    }
+    if not updates:
+        return
+
+    for key_path, value in updates.items():
+        _set_nested(settings, key_path, value)
+
+    # Re-mirror the tree so any intermediate dicts created above get
+    # flat entries too; the settings tree is small enough that a full
+    # walk is cheaper than tracking what changed.
+    _flat_cache.clear()
+    _flatten(settings)
+
+    _write_settings(settings)
+
+
+def save_setting(key_path: str, value: Any) -> None:
+    """Save a setting using dot notation and persist to settings.json.
+
+    Example: save_setting('naming_conventions.mesh_prefix', 'SM_')
+    """
+
+    save_settings({key_path: value})
 
 
 def reset_default() -> None:
@@ -0,0 +1,100 @@
+"""Persistent import daemon run inside Unreal Editor.
+
+Launched with -ExecutePythonScript=ue_daemon.py -daemonport=<port>
+[-manifest=<path>]. Ingests the optional startup manifest, then keeps
+listening on localhost for newline-terminated manifest paths pushed by
+the Blender addon, so repeat exports skip the multi-second editor
+startup.
+"""
+
+import os
+import socket
+import sys
+import unreal
+
+# -ExecutePythonScript doesn't put the script's folder on sys.path.
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import ue_import
+
+_server: socket.socket | None = None
+
+# Open client connections and their partial-line read buffers.
+_connections: dict[socket.socket, bytearray] = {}
+
+
+def _drain_buffer(buf: bytearray) -> None:
+    while b"\n" in buf:
+        line, _, rest = bytes(buf).partition(b"\n")
+        buf[:] = rest
+
+        manifest_path = line.decode("utf-8", errors="replace").strip()
+        if manifest_path:
+            unreal.log(f"[AssetForge] Daemon ingesting: {manifest_path}")
+            ue_import.ingest_manifest_file(manifest_path)
+
+
+def _tick(delta_seconds: float) -> None:
+    """Poll the listen socket without blocking the editor's game thread.
+
+    Imports run here because the unreal API is only safe on this thread.
+    """
+
+    assert _server is not None
+
+    try:
+        while True:
+            conn, _ = _server.accept()
+            conn.setblocking(False)
+            _connections[conn] = bytearray()
+    except (BlockingIOError, OSError):
+        pass
+
+    for conn in list(_connections):
+        buf = _connections[conn]
+
+        try:
+            chunk = conn.recv(4096)
+        except BlockingIOError:
+            continue
+        except OSError:
+            chunk = b""
+
+        if chunk:
+            buf += chunk
+            _drain_buffer(buf)
+        else:
+            # EOF: the addon sends one line and disconnects.
+            _drain_buffer(buf)
+            conn.close()
+            del _connections[conn]
+
+
+def main() -> int:
+    global _server
+
+    port_value = ue_import.get_cli_value("daemonport")
+    if not port_value:
+        unreal.log_error("Missing required argument: -daemonport=<port>")
+        return 2
+
+    _server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    _server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    _server.bind(("127.0.0.1", int(port_value)))
+    _server.listen()
+    _server.setblocking(False)
+
+    # The launch that started the daemon may carry a first manifest.
+    startup_manifest = ue_import.get_cli_value("manifest")
+    if startup_manifest:
+        ue_import.ingest_manifest_file(startup_manifest)
+
+    unreal.register_slate_post_tick_callback(_tick)
+    unreal.log(f"[AssetForge] Import daemon listening on 127.0.0.1:{port_value}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    # No SystemExit: the editor must stay alive to keep serving imports.
+    main()
@@ -1,5 +1,7 @@
 from os.path import splitext
+from functools import lru_cache
 import unreal
+import hashlib
 import json
 import re
 import traceback
@@ -9,28 +11,89 @@ import os
 from pathlib import Path
 from typing import Any, cast
 
-# Debug logging
+# orjson parses bytes directly in C; fall back to the stdlib when it
+# isn't available in the editor's Python.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# unreal.Name construction crosses into UObject allocation; cache the
+# handful of parameter/switch names reused across materials.
+_name_cache: dict[str, unreal.Name] = {}
+
+
+def _N(s: str) -> unreal.Name:
+    name = _name_cache.get(s)
+    if name is None:
+        name = _name_cache[s] = unreal.Name(s)
+    return name
+
+
+# Debug logging: off by default so release ingests pay no log I/O.
+# When enabled, the handle is opened once and buffered instead of an
+# open/write/close round trip per line.
+_DEBUG = False
+
+_LOG_FH = None
+if _DEBUG:
+    try:
+        _LOG_FH = open(
+            os.path.join(tempfile.gettempdir(), "asset_forge_debug.log"),
+            "a", buffering=8192,
+        )
+    except OSError:
+        _LOG_FH = None
+
+
 def _debug_log(msg: str):
-    log_path = os.path.join(tempfile.gettempdir(), "asset_forge_debug.log")
-    with open(log_path, "a") as f:
-        f.write(f"{msg}\n")
+    if _LOG_FH is not None:
+        _LOG_FH.write(f"{msg}\n")
+
+
+# Asset tools handle memoized: get_asset_tools crosses the reflected
+# UFUNCTION boundary on every call.
+_asset_tools = None
+
+
+def _get_tools():
+    global _asset_tools
+    if _asset_tools is None:
+        _asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+    return _asset_tools
+
+
+# Folders already created this editor session, so batch ingests skip
+# repeated make_directory round trips.
+_ensured_folders: set[str] = set()
 
 
 def _ensure_folder(path: str) -> None:
-    unreal.EditorAssetLibrary.make_directory(path)
+    if path not in _ensured_folders:
+        unreal.EditorAssetLibrary.make_directory(path)
+        _ensured_folders.add(path)
 
 
-def _import_file(filepath: str, destination: str) -> list[str]:
+@lru_cache(maxsize=32)
+def _load_master(path: str):
+    """Load a master material once per editor session; batch ingests
+    usually share one master across every asset.
+    """
+
+    return unreal.load_asset(path)
+
+
+def _make_import_task(filepath: str, destination: str, options: Any = None) -> unreal.AssetImportTask:
     task = unreal.AssetImportTask()
     task.set_editor_property("filename", filepath)
     task.set_editor_property("destination_path", destination)
     task.set_editor_property("automated", True)
     task.set_editor_property("replace_existing", True)
     task.set_editor_property("save", True)
+    if options is not None:
+        task.set_editor_property("options", options)
 
-    tasks = cast(unreal.Array, [task])
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
-    return list(task.get_editor_property("imported_object_paths") or [])
+    return task
 
 
 def _load_first(imported_paths: list[str]):
@@ -42,104 +105,195 @@ def _load_first(imported_paths: list[str]):
     return None
 
 
-def _import_fbx(fbx_path: str, mesh_folder: str) -> unreal.StaticMesh:
-    task = unreal.AssetImportTask()
-    task.set_editor_property("filename", fbx_path)
-    task.set_editor_property("destination_path", mesh_folder)
-    task.set_editor_property("automated", True)
-    task.set_editor_property("replace_existing", True)
-    task.set_editor_property("save", True)
-
+def _make_fbx_task(fbx_path: str, mesh_folder: str) -> unreal.AssetImportTask:
     ui = unreal.FbxImportUI()
     ui.set_editor_property("import_as_skeletal", False)
     ui.set_editor_property("import_mesh", True)
     ui.set_editor_property("import_materials", False)
-    ui.set_editor_property("import_textures", False) 
-    task.set_editor_property("options", ui)
+    ui.set_editor_property("import_textures", False)
 
-    tasks = cast(unreal.Array, [task])
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
-
-    imported_mesh_paths = list(task.get_editor_property("imported_object_paths") or [])
-    mesh_asset = _load_first(imported_mesh_paths)
+    return _make_import_task(fbx_path, mesh_folder, ui)
 
-    if not isinstance(mesh_asset, unreal.StaticMesh):
-        raise RuntimeError(f"Expected a StaticMesh import; got {type(mesh_asset)} from {imported_mesh_paths}")
-    
-    return mesh_asset
 
+def _canon_path(path: str) -> str:
+    """Canonical filesystem key for a texture path.
 
-def _import_textures(manifest_data, texture_destination_folder: str) -> dict[str, unreal.Texture]:
-    """Checks if a material parameter uses an image texture and imports the texture into Unreal project if it exists.
-    
-    Takes the JSON file containing material data and the destination folder as inputs.
+    normcase folds case on Windows so the same file referenced with
+    different casing doesn't import twice on a case-insensitive FS.
     """
 
-    texture_lookup_by_path: dict[str, unreal.Texture] = {}
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _collect_texture_slots(manifest_data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Gathers unique on-disk texture slots from the manifest's material parameters, keyed by canonical path."""
+
+    candidates: dict[str, dict[str, Any]] = {}
     for mat in manifest_data.get("materials", []):
         params = mat.get("parameters", {})
         for _, slot in params.items():
             if not slot or slot.get("type") != "texture":
                 continue
 
-            tex_path = slot.get("path")
-            p = Path(tex_path)
-            # Possible for texture to not have a path. For example, if you are texture
-            # painting in Blender you can save the texture in the Blender scene without
-            # saving texture to disk.
-            if not p.exists():
-                unreal.log_warning(f"Texture missing on disk: {tex_path}")
+            raw_path = slot.get("path")
+            if not raw_path:
                 continue
 
-            # Skip if texture already imported to Unreal Engine
-            if tex_path in texture_lookup_by_path:
+            tex_path = _canon_path(raw_path)
+            # Skip if texture already queued for import
+            if tex_path in candidates:
                 continue
 
-            imported_tex_paths = _import_file(tex_path, texture_destination_folder)
-            tex_asset = _load_first(imported_tex_paths)
-
-            if isinstance(tex_asset, unreal.Texture):
-                original_name = slot.get("original_name", "")
-                normalized_name = slot.get("normalized_name", "")
-                if original_name != normalized_name:
-                    _debug_log(f"Renaming image texture {original_name} to {normalized_name}")
-                    new_name, _ = splitext(slot.get("normalized_name"))
-                    new_path: str = texture_destination_folder + "/" + new_name
-                    _debug_log(f"New path: {new_path}")
-                    old_path: str = unreal.EditorAssetLibrary.get_path_name_for_loaded_asset(tex_asset)
-                    unreal.EditorAssetLibrary.rename_asset(old_path, new_path)
-                texture_lookup_by_path[tex_path] = tex_asset
-            else:
-                unreal.log_warning(f"Imported non-texture from {tex_path}: {imported_tex_paths}")
-        
-    return texture_lookup_by_path
+            candidates[tex_path] = slot
 
+    # One directory listing per source folder instead of a stat syscall
+    # per texture; exports typically pull many textures from one folder.
+    present_by_dir: dict[str, set[str]] = {}
 
-def _populate_material_instance(mat_instance: unreal.MaterialInstanceConstant, mat_data: dict[str, Any], texture_lookup: dict[str, unreal.Texture]) -> None:
-    """Populates a material instance with parameter values based on the material data from the JSON manifest."""
+    slots: dict[str, dict[str, Any]] = {}
+    for tex_path, slot in candidates.items():
+        tex_dir = os.path.dirname(tex_path)
+        present = present_by_dir.get(tex_dir)
+        if present is None:
+            try:
+                # tex_path is already normcase-folded, so fold the
+                # listing the same way before membership tests.
+                present = {os.path.normcase(entry.name) for entry in os.scandir(tex_dir)}
+            except OSError:
+                present = set()
+            present_by_dir[tex_dir] = present
+
+        # Possible for texture to not have a path on disk. For example, if you are
+        # texture painting in Blender you can save the texture in the Blender scene
+        # without saving texture to disk.
+        if os.path.basename(tex_path) not in present:
+            unreal.log_warning(f"Texture missing on disk: {tex_path}")
+            continue
+
+        slots[tex_path] = slot
+
+    return slots
+
+
+def _finalize_texture(slot: dict[str, Any], tex_asset: unreal.Texture, texture_path_prefix: str) -> str:
+    """Renames an imported texture to its normalized name when they differ.
+
+    Takes the destination folder as a prefix ending in '/' so callers
+    hoist the concatenation out of their loops. Returns the texture's
+    final asset path.
+    """
+
+    original_name = slot.get("original_name", "")
+    normalized_name = slot.get("normalized_name", "")
+    if original_name != normalized_name:
+        _debug_log(f"Renaming image texture {original_name} to {normalized_name}")
+        new_name, _ = splitext(slot.get("normalized_name"))
+        new_path: str = texture_path_prefix + new_name
+        _debug_log(f"New path: {new_path}")
+        old_path: str = unreal.EditorAssetLibrary.get_path_name_for_loaded_asset(tex_asset)
+        unreal.EditorAssetLibrary.rename_asset(old_path, new_path)
+        return new_path
+
+    return unreal.EditorAssetLibrary.get_path_name_for_loaded_asset(tex_asset)
+
+
+# Texture import cache: (mtime, size) per source path plus the asset it
+# produced last time, persisted under the project's Saved folder so
+# unchanged textures skip re-import on repeat ingests.
+_TEX_CACHE_FILENAME = "af_texture_cache.json"
+
+
+def _texture_cache_path() -> str:
+    return os.path.join(unreal.Paths.project_saved_dir(), _TEX_CACHE_FILENAME)
+
+
+def _load_texture_cache() -> dict[str, Any]:
+    try:
+        raw = Path(_texture_cache_path()).read_bytes()
+        cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_texture_cache(cache: dict[str, Any]) -> None:
+    try:
+        if orjson is not None:
+            Path(_texture_cache_path()).write_bytes(orjson.dumps(cache))
+        else:
+            Path(_texture_cache_path()).write_text(json.dumps(cache))
+    except OSError as e:
+        unreal.log_warning(f"Could not persist texture cache: {e}")
+
+
+# Project-level content index: sha1(file bytes) -> UE texture path, so
+# the same map referenced by several assets (shared normal/roughness
+# textures) is imported once and reused everywhere. Lives next to the
+# per-path cache; destination folders are /Game paths, not on disk.
+_TEX_INDEX_FILENAME = "af_texture_index.json"
 
-    parameters = mat_data.get("parameters", {})
 
-    _debug_log(f"Populating material instance {mat_instance.get_name()} with parameters: {parameters}")
+def _texture_index_path() -> str:
+    return os.path.join(unreal.Paths.project_saved_dir(), _TEX_INDEX_FILENAME)
 
-    for param_name, param_data in parameters.items():
-        param_type = param_data.get("type")
 
-        if param_type == "texture":
-            tex_path = param_data.get("path")
-            texture = texture_lookup.get(tex_path)
+def _load_texture_index() -> dict[str, str]:
+    try:
+        raw = Path(_texture_index_path()).read_bytes()
+        index = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
 
-            switch_param = "Use" + param_name + "Texture"
+    return index if isinstance(index, dict) else {}
+
+
+def _save_texture_index(index: dict[str, str]) -> None:
+    try:
+        if orjson is not None:
+            Path(_texture_index_path()).write_bytes(orjson.dumps(index))
+        else:
+            Path(_texture_index_path()).write_text(json.dumps(index))
+    except OSError as e:
+        unreal.log_warning(f"Could not persist texture index: {e}")
+
+
+def _texture_content_hash(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def _populate_material_instance(mat_instance: unreal.MaterialInstanceConstant, mat_data: dict[str, Any], texture_lookup: dict[str, unreal.Texture]) -> None:
+    """Populates a material instance with parameter values based on the material data from the JSON manifest."""
+
+    param_list = mat_data.get("param_list")
+    if param_list is None:
+        # Pre-0.2.0 manifests carry only the parameters dict; flatten it
+        # to the same (name, kind, value) shape.
+        param_list = [
+            [name, p.get("type"), p.get("path") if p.get("type") == "texture" else p.get("value")]
+            for name, p in mat_data.get("parameters", {}).items()
+        ]
+
+    _debug_log(f"Populating material instance {mat_instance.get_name()} with parameters: {param_list}")
+
+    for param_name, kind, value in param_list:
+        if kind == "texture":
+            texture = texture_lookup.get(_canon_path(value)) if value else None
 
             unreal.MaterialEditingLibrary.set_material_instance_static_switch_parameter_value(
                 instance=mat_instance,
-                parameter_name=unreal.Name(switch_param),
+                parameter_name=_N(f"Use{param_name}Texture"),
                 value=True
             )
-            
+
             unreal.MaterialEditingLibrary.set_material_instance_texture_parameter_value(
                 instance=mat_instance,
-                parameter_name=unreal.Name(param_name),
+                parameter_name=_N(param_name),
                 value=texture
             )
 
@@ -150,14 +304,15 @@ def _create_material_instance(mat_instance_name: str, mat_path: str, mat_master:
     Returns the material instance.
     """
 
-    if unreal.load_asset(f"{mat_path}/{mat_instance_name}") is not None:
+    existing = unreal.load_asset(f"{mat_path}/{mat_instance_name}")
+    if existing is not None:
         _debug_log(f"Material instance already exists, loading: {mat_path}/{mat_instance_name}")
-        return unreal.load_asset(f"{mat_path}/{mat_instance_name}")
+        return existing
 
     factory = unreal.MaterialInstanceConstantFactoryNew()
     _debug_log(f"Material instance factory created: {factory}")
 
-    material_instance = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
+    material_instance = _get_tools().create_asset(
         asset_name=mat_instance_name,
         package_path=mat_path,
         asset_class=unreal.MaterialInstanceConstant, # type: ignore
@@ -173,31 +328,26 @@ def _create_material_instance(mat_instance_name: str, mat_path: str, mat_master:
     return material_instance
 
 
-def ingest_asset(json_path: str) -> None:
+def ingest_asset(data: dict[str, Any]) -> None:
     """Imports asset and image textures to Unreal Editor and creates material instances if materials
     are assigned in Blender and a master material is selected.
 
-    Does not use FBX default import settings so only the mesh gets imported automatically. Other assets 
+    Does not use FBX default import settings so only the mesh gets imported automatically. Other assets
     get imported manually.
     """
-   
+
     _debug_log("Starting UE import.")
-    manifest_path = Path(json_path)
-    if not manifest_path.exists():
-        _debug_log(f"Manifest not found at {manifest_path}")
-        raise FileNotFoundError(f"Manifest not found: {json_path}.")
-    
-    data = json.loads(manifest_path.read_text())
 
+    # Destructure the manifest once; everything below works from locals.
     asset_name = data["source"]["normalized_name"]
     fbx_path = data["export"]["export_path"]
+    ue_config = data.get("unreal", {})
+    material_data = data.get("materials", [])
     _debug_log(f"Object path: {fbx_path}")
-    # fbx_path += f"/{asset_name}.fbx"
 
     if not Path(fbx_path).exists():
         raise FileNotFoundError(f"FBX not found: {fbx_path}")
 
-    ue_config = data.get("unreal", {})
     DEST_ROOT = ue_config.get("ue_assets_directory", "/Game/Assets")
     MASTER_MAT_PATH = ue_config.get("ue_master_material", "")
 
@@ -206,24 +356,98 @@ def ingest_asset(json_path: str) -> None:
     tex_folder  = f"{base_folder}/Textures"
     mat_folder  = f"{base_folder}/Materials"
 
-    _ensure_folder(mesh_folder)
-    _ensure_folder(tex_folder)
+    # make_directory creates parents, and import_asset_tasks creates the
+    # mesh/texture leaf folders from destination_path, so one ensure on
+    # the deepest pre-needed folder (material instances are created via
+    # create_asset, which doesn't make directories) covers everything.
     _ensure_folder(mat_folder)
-    
-    mesh_asset = _import_fbx(fbx_path, mesh_folder)
 
-    unreal.EditorAssetLibrary.save_loaded_asset(mesh_asset)
+    texture_slots = _collect_texture_slots(data)
+
+    # Textures whose source file is unchanged since the last ingest and
+    # whose asset still exists skip the import task entirely.
+    tex_cache = _load_texture_cache()
+    tex_index = _load_texture_index()
+    texture_lookup_by_path: dict[str, unreal.Texture] = {}
+    pending_slots: dict[str, dict[str, Any]] = {}
+    tex_stats: dict[str, tuple[float, int]] = {}
+    tex_hashes: dict[str, str] = {}
+    for tex_path, slot in texture_slots.items():
+        try:
+            st = os.stat(tex_path)
+        except OSError:
+            continue
+        tex_stats[tex_path] = (st.st_mtime, st.st_size)
+
+        entry = tex_cache.get(tex_path)
+        if (
+            entry
+            and entry.get("mtime") == st.st_mtime
+            and entry.get("size") == st.st_size
+            and unreal.EditorAssetLibrary.does_asset_exist(entry.get("ue_path", ""))
+        ):
+            cached_asset = unreal.load_asset(entry["ue_path"])
+            if isinstance(cached_asset, unreal.Texture):
+                texture_lookup_by_path[tex_path] = cached_asset
+                continue
+
+        # Per-path cache missed; an identical file may still have been
+        # imported under another path or name for a different asset.
+        content_hash = _texture_content_hash(tex_path)
+        tex_hashes[tex_path] = content_hash
+        existing_ue_path = tex_index.get(content_hash, "")
+        if existing_ue_path and unreal.EditorAssetLibrary.does_asset_exist(existing_ue_path):
+            dedup_asset = unreal.load_asset(existing_ue_path)
+            if isinstance(dedup_asset, unreal.Texture):
+                texture_lookup_by_path[tex_path] = dedup_asset
+                mtime, size = tex_stats[tex_path]
+                tex_cache[tex_path] = {"mtime": mtime, "size": size, "ue_path": existing_ue_path}
+                continue
+
+        pending_slots[tex_path] = slot
+
+    # One import_asset_tasks call for the mesh plus every unique
+    # texture: a single Python<->Unreal round trip and one batched
+    # asset-registry/save pass instead of one per file.
+    fbx_task = _make_fbx_task(fbx_path, mesh_folder)
+    tex_tasks: dict[str, unreal.AssetImportTask] = {
+        tex_path: _make_import_task(tex_path, tex_folder) for tex_path in pending_slots
+    }
+
+    tasks = cast(unreal.Array, [fbx_task, *tex_tasks.values()])
+    _get_tools().import_asset_tasks(tasks)
+
+    imported_mesh_paths = list(fbx_task.get_editor_property("imported_object_paths") or [])
+    mesh_asset = _load_first(imported_mesh_paths)
+    if not isinstance(mesh_asset, unreal.StaticMesh):
+        raise RuntimeError(f"Expected a StaticMesh import; got {type(mesh_asset)} from {imported_mesh_paths}")
+
     unreal.log(f"[Ingest] Done: {asset_name} -> {base_folder}")
 
-    texture_lookup_by_path: dict[str, unreal.Texture] = _import_textures(data, tex_folder)
+    tex_prefix = tex_folder + "/"
+    for tex_path, task in tex_tasks.items():
+        tex_asset = _load_first(list(task.get_editor_property("imported_object_paths") or []))
+        if isinstance(tex_asset, unreal.Texture):
+            ue_path = _finalize_texture(pending_slots[tex_path], tex_asset, tex_prefix)
+            texture_lookup_by_path[tex_path] = tex_asset
+
+            mtime, size = tex_stats[tex_path]
+            tex_cache[tex_path] = {"mtime": mtime, "size": size, "ue_path": ue_path}
+            tex_index[tex_hashes[tex_path]] = ue_path
+        else:
+            unreal.log_warning(f"Imported non-texture from {tex_path}")
+
+    if tex_tasks:
+        _save_texture_cache(tex_cache)
+        _save_texture_index(tex_index)
 
-    material_data = data.get("materials", [])
     _debug_log(f"Material data: {material_data}")
     _debug_log(f"Master material path: {MASTER_MAT_PATH}")
-    master_mat = unreal.load_asset(MASTER_MAT_PATH)
+    master_mat = _load_master(MASTER_MAT_PATH)
     _debug_log(f"Loaded master material: {master_mat}")
     _debug_log(f"Asset material folder: {mat_folder}")
 
+    to_save: list[Any] = []
     for index, mat in enumerate(material_data):
         try:
             mat_name = mat.get("normalized_name", "MaterialInstance")
@@ -234,7 +458,7 @@ def ingest_asset(json_path: str) -> None:
 
             _populate_material_instance(mat_instance, mat, texture_lookup_by_path)
 
-            unreal.EditorAssetLibrary.save_loaded_asset(mat_instance)
+            to_save.append(mat_instance)
             unreal.log(f"[Ingest] Created material instance: {mat_name}")
 
             # For some reason, materials need to be both added and set for multiple materials 
@@ -243,20 +467,65 @@ def ingest_asset(json_path: str) -> None:
                 mesh_asset.add_material(mat_instance)
             mesh_asset.set_material(index, mat_instance)
             _debug_log(f"Set material {mat_name} to mesh {mesh_asset.get_name()} at slot {index}")
-
-            unreal.EditorAssetLibrary.save_loaded_asset(mesh_asset)
-            _debug_log(f"Added material instance to mesh: {mat_name} -> {mesh_asset.get_name()}")
         except Exception as e:
             _debug_log(f"ERROR creating material {mat_name}: {e}")
             _debug_log(traceback.format_exc())
 
+    # One save pass after the loop instead of a full serialize per
+    # material instance plus per-slot mesh saves.
+    to_save.append(mesh_asset)
+    for asset in to_save:
+        unreal.EditorAssetLibrary.save_loaded_asset(asset)
+
+
+def ingest_manifest_file(manifest_path: str) -> int:
+    """Ingest a manifest file holding either one manifest dict or a batch
+    array of them. Returns the number of entries that failed.
+    """
+
+    path = Path(manifest_path)
+    if not path.exists():
+        unreal.log_error(f"Manifest not found: {manifest_path}")
+        return 1
+
+    if orjson is not None:
+        data = orjson.loads(path.read_bytes())
+    else:
+        data = json.loads(path.read_text())
+
+    # A batch manifest is a JSON array of per-asset manifests; a single
+    # export ships the manifest dict directly.
+    entries = data if isinstance(data, list) else [data]
+
+    failures = 0
+    for entry in entries:
+        try:
+            ingest_asset(entry)
+        except Exception as e:
+            unreal.log_error(f"[AssetForge] Ingest failed for {entry.get('source', {}).get('object_name', '?')}: {e}")
+            _debug_log(traceback.format_exc())
+            failures += 1
+
+    return failures
+
+
+_CLI_RE = re.compile(r'(?:^|\s)-(\w+)=(?:"([^"]+)"|(\S+))')
+
+# Parsed -key=value tokens, built on first query so every flag lookup
+# after that is a dict get instead of a fresh regex compile + search.
+_cli_values: dict[str, str] | None = None
+
 
 def get_cli_value(name: str) -> str | None:
-    cmd = unreal.SystemLibrary.get_command_line()
-    m = re.search(rf'(?:^|\s)-{re.escape(name)}=(?:"([^"]+)"|(\S+))', cmd)
-    if not m:
-        return None
-    return m.group(1) or m.group(2)
+    global _cli_values
+
+    if _cli_values is None:
+        cmd = unreal.SystemLibrary.get_command_line()
+        _cli_values = {
+            m.group(1): m.group(2) or m.group(3) for m in _CLI_RE.finditer(cmd)
+        }
+
+    return _cli_values.get(name)
 
 
 def main() -> int:
@@ -267,9 +536,7 @@ def main() -> int:
 
     unreal.log(f"[AssetForge] manifest: {manifest_path}")
 
-    ingest_asset(manifest_path)
-
-    return 0
+    return 1 if ingest_manifest_file(manifest_path) else 0
 
 
 if __name__ == "__main__":
@@ -1,58 +1,201 @@
 import bpy
+import hashlib
 import os
 import json
+import numpy as np
 
+from functools import lru_cache
 from typing import Any
 from .. import config
+from .mesh_metadata import vertex_array
 
-def export_active_mesh_fbx(export_path: str, manifest: dict[str, Any] | None, export_ext: str) -> None:
-    """Exports current active mesh as fbx. Creates export directory if 
-    one doesn't already exist.
+# Sidecar file in the export directory mapping normalized mesh names to
+# content hashes of the last exported geometry.
+_CACHE_FILENAME = ".af_cache.json"
+
+# Directories already created this session, so repeated exports to the
+# same folder skip the makedirs syscalls.
+_made_dirs: set[str] = set()
+
+# Constant exporter options, built once instead of per call.
+_FBX_KWARGS: dict[str, Any] = dict(
+    use_selection=True,
+    apply_unit_scale=True,
+    apply_scale_options="FBX_SCALE_ALL",
+    object_types={"MESH"},
+    use_mesh_modifiers=True,
+    add_leaf_bones=False,
+    bake_anim=False,
+)
+
+_OBJ_KWARGS: dict[str, Any] = dict(
+    export_selected_objects=True,
+    apply_modifiers=True,
+    export_animation=False,
+    apply_transform=True,
+    export_materials=False,
+)
+
+
+@lru_cache(maxsize=1)
+def _get_axes() -> tuple[str, str, str, str]:
+    """Axis conversion settings, read from config once per session.
+
+    Returns (fbx_forward, fbx_up, obj_forward, obj_up). Axis conventions
+    don't change mid-session; call _get_axes.cache_clear() after a
+    config reload if they ever need to.
     """
 
-    os.makedirs(os.path.dirname(export_path), exist_ok=True)
+    return (
+        config.get_setting("export.fbx_axis_forward", default="-Y"),
+        config.get_setting("export.fbx_axis_up", default="Z"),
+        config.get_setting("export.obj_axis_forward", default="NEGATIVE_Y"),
+        config.get_setting("export.obj_axis_up", default="Z"),
+    )
+
+
+def ensure_export_dir(export_dir: str) -> None:
+    """Create the export directory if this session hasn't already."""
+
+    if export_dir not in _made_dirs:
+        os.makedirs(export_dir, exist_ok=True)
+        _made_dirs.add(export_dir)
+
+# orjson serializes in C and is several times faster than the stdlib
+# encoder; fall back to json when the wheel isn't bundled.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def mesh_content_hash(obj: Any) -> str:
+    """Hash the source geometry and modifier stack of a mesh object.
+
+    Vertex coordinates and polygon loop totals are bulk-read through
+    foreach_get and hashed with blake2b, so the cost is one memcpy plus
+    a C-side hash rather than a Python loop over the mesh.
+    """
+
+    mesh = obj.data
+
+    coords = vertex_array(mesh)
+
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(coords.tobytes())
+    h.update(loop_totals.tobytes())
+    h.update(repr([(m.type, m.show_viewport) for m in obj.modifiers]).encode())
+    h.update(repr([s.name for s in obj.material_slots]).encode())
+
+    return h.hexdigest()
+
+
+def _load_mesh_cache(export_dir: str) -> dict[str, str]:
+    cache_path = os.path.join(export_dir, _CACHE_FILENAME)
+
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    return cache if isinstance(cache, dict) else {}
+
+
+def is_mesh_cached(export_dir: str, normalized_name: str, content_hash: str, final_mesh_path: str) -> bool:
+    """Return True if the last export of this mesh had identical geometry
+    and its file is still on disk, in which case the FBX write can be
+    skipped entirely.
+    """
+
+    cache = _load_mesh_cache(export_dir)
+    return cache.get(normalized_name) == content_hash and os.path.exists(final_mesh_path)
+
+
+def record_mesh_hash(export_dir: str, normalized_name: str, content_hash: str) -> None:
+    cache = _load_mesh_cache(export_dir)
+    cache[normalized_name] = content_hash
+
+    with open(os.path.join(export_dir, _CACHE_FILENAME), "w") as f:
+        json.dump(cache, f)
+
+
+class _OperatorStub:
+    """Minimal stand-in for the operator argument export_fbx_bin.save expects."""
+
+    def report(self, levels: set, message: str) -> None:
+        print(f"[AssetForge] FBX export: {message}")
+
+
+def _export_fbx_direct(export_path: str, axis_forward: str, axis_up: str) -> bool:
+    """Export through io_scene_fbx's save() directly, skipping the operator
+    dispatcher (context override, undo push, redo panel).
+
+    Returns False when the bundled FBX addon isn't importable so the
+    caller can fall back to bpy.ops.
+    """
+
+    try:
+        from io_scene_fbx import export_fbx_bin
+        from bpy_extras.io_utils import axis_conversion
+    except ImportError:
+        return False
+
+    global_matrix = axis_conversion(to_forward=axis_forward, to_up=axis_up).to_4x4()
+    export_fbx_bin.save(
+        _OperatorStub(),
+        bpy.context,
+        filepath=export_path,
+        apply_unit_scale=_FBX_KWARGS["apply_unit_scale"],
+        apply_scale_options=_FBX_KWARGS["apply_scale_options"],
+        object_types=_FBX_KWARGS["object_types"],
+        use_selection=_FBX_KWARGS["use_selection"],
+        use_mesh_modifiers=_FBX_KWARGS["use_mesh_modifiers"],
+        add_leaf_bones=_FBX_KWARGS["add_leaf_bones"],
+        bake_anim=_FBX_KWARGS["bake_anim"],
+        global_matrix=global_matrix,
+    )
+    return True
+
+
+def export_active_mesh_fbx(export_path: str, export_ext: str) -> None:
+    """Exports the selected mesh object as fbx. The caller is responsible
+    for selecting the object and creating the export directory.
+    """
+
+    fbx_axis_forward, fbx_axis_up, obj_axis_forward, obj_axis_up = _get_axes()
 
     if export_ext == "obj":
         bpy.ops.wm.obj_export(
             filepath=export_path,
-            export_selected_objects=True,
-            apply_modifiers=True,
-            export_animation=False,
-            apply_transform=True,
-            export_materials=False,
-            forward_axis=config.get_setting("export.obj_axis_forward", default='NEGATIVE_Y'),
-            up_axis=config.get_setting("export.obj_axis_up", default='Z')
+            forward_axis=obj_axis_forward,
+            up_axis=obj_axis_up,
+            **_OBJ_KWARGS
         )
     elif export_ext == "fbx":
-        bpy.ops.export_scene.fbx(
-            filepath=export_path,
-            use_selection=True,
-            apply_unit_scale=True,
-            apply_scale_options="FBX_SCALE_ALL",
-            object_types={"MESH"},
-            use_mesh_modifiers=True,
-            add_leaf_bones=False,
-            bake_anim=False,
-            axis_forward=config.get_setting("export.fbx_axis_forward", default="-Y"),
-            axis_up=config.get_setting("export.fbx_axis_up", default="Z"),
-        )
+        axis_forward = fbx_axis_forward
+        axis_up = fbx_axis_up
 
-    if manifest is not None:
-        mesh = manifest.get("source", {})
-        export = manifest.get("export", {})
-        if mesh.get("object_name", "") != mesh.get("normalized_name", ""):
-            export_dir = export.get("export_dir", "")
-            original_file = f"{export_dir}/{mesh.get("object_name", "")}"
-            os.rename(f"{original_file}.fbx", f"{export_dir}/{mesh.get("normalized_name", "")}.{export_ext}")
-            os.rename(f"{original_file}.json", f"{export_dir}/{mesh.get("normalized_name", "")}.json")
+        if not _export_fbx_direct(export_path, axis_forward, axis_up):
+            bpy.ops.export_scene.fbx(
+                filepath=export_path,
+                axis_forward=axis_forward,
+                axis_up=axis_up,
+                **_FBX_KWARGS
+            )
 
 
-def export_mesh_metadata(export_path: str, mesh_data: dict[str, Any]) -> None:
-    """Exports metadata as JSON file. Creates export directory if
-    one doesn't currently exist.
+def export_mesh_metadata(export_path: str, mesh_data: dict[str, Any] | list[dict[str, Any]]) -> None:
+    """Exports metadata as JSON file. Accepts a single manifest dict or a
+    batch list of them. The caller is responsible for creating the export
+    directory.
     """
 
-    os.makedirs(os.path.dirname(export_path), exist_ok=True)
-
-    with open(export_path, "w") as f:
-        json.dump(mesh_data, f)
+    if orjson is not None:
+        with open(export_path, "wb") as f:
+            f.write(orjson.dumps(mesh_data))
+    else:
+        with open(export_path, "w") as f:
+            json.dump(mesh_data, f)
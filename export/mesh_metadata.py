@@ -1,68 +1,208 @@
 import bpy
+import copy
 import datetime
 import os
+import numpy as np
 
 from bpy import types as bt
+from dataclasses import asdict, dataclass
 from typing import Any
 from ..validation import naming
 
-def get_evaluated_mesh_stats(obj: bt.Object, context: bt.Context) -> dict[str, int]:
+
+@dataclass(slots=True, frozen=True)
+class MeshStats:
+    """Basic mesh statistics. Slot access keeps hot field reads cheap;
+    converted to a dict only at the JSON boundary.
+    """
+
+    vertices: int
+    edges: int
+    faces: int
+    triangles: int
+
+# Invariant portion of the export manifest, copied and filled per export.
+_META_SKELETON: dict[str, Any] = {
+    "schema": "asset_forge.export",
+    "schema_version": "0.2.0",
+    "export": {
+        "target": "unreal",
+    },
+}
+
+def vertex_array(mesh: bt.Mesh) -> np.ndarray:
+    """Bulk-read vertex coordinates into a flat float32 array.
+
+    One C memcpy through foreach_get instead of a Python loop over
+    vertices; callers reshape(-1, 3) for per-vertex math.
+    """
+
+    arr = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", arr)
+    return arr
+
+
+def _count_mesh_stats(mesh: bt.Mesh) -> MeshStats:
+    """Return vertex/edge/face/triangle counts for a mesh datablock."""
+
+    # Blender's triangulation cache gives an exact count (including
+    # concave polygons) in a single C pass.
+    mesh.calc_loop_triangles()
+
+    return MeshStats(
+        vertices=len(mesh.vertices),
+        edges=len(mesh.edges),
+        faces=len(mesh.polygons),
+        triangles=len(mesh.loop_triangles),
+    )
+
+
+# Evaluated stats per object pointer, valid until the next depsgraph
+# update. Export passes that stat the same object more than once (e.g.
+# metadata plus validation) skip the repeated modifier evaluation.
+_stats_cache: dict[int, MeshStats] = {}
+
+
+# persistent keeps the handler installed across .blend loads; without
+# it Blender drops the handler on the first file load and the cache
+# would never be invalidated again (stale stats, and recycled
+# as_pointer() keys could even alias another object).
+@bpy.app.handlers.persistent
+def _af_clear_stats_cache(scene: Any, depsgraph: Any = None) -> None:
+    _stats_cache.clear()
+
+
+# Registered at module import (this module loads lazily on first
+# export), on load_post too since pointer keys from the previous file
+# are meaningless in the new one. Remove any handler left from a
+# previous load by name so addon reloads don't stack duplicates.
+for _handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+    for _h in [h for h in _handlers if getattr(h, "__name__", "") == "_af_clear_stats_cache"]:
+        _handlers.remove(_h)
+    _handlers.append(_af_clear_stats_cache)
+del _handlers
+
+
+def get_evaluated_mesh_stats(obj: bt.Object, context: bt.Context) -> MeshStats:
     """Return mesh statistics after all modifiers are evaluated.
 
-    A temporary evaluated mesh is created to compute statistics and is
-    cleared before returning.
+    When the object has no modifiers the source mesh is already final,
+    so stats are read directly from it. Otherwise a temporary evaluated
+    mesh is created to compute statistics and is cleared before
+    returning; results are cached per object until the depsgraph next
+    updates.
     """
 
+    if not obj.modifiers:
+        mesh = obj.data
+        assert isinstance(mesh, bt.Mesh)
+        return _count_mesh_stats(mesh)
+
+    key = obj.as_pointer()
+    cached = _stats_cache.get(key)
+    if cached is not None:
+        return cached
+
     depsgraph: Any = context.evaluated_depsgraph_get()
     obj_eval: bt.Object = obj.evaluated_get(depsgraph)
 
-    mesh_eval: bt.Mesh = obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+    # Stats only need the counts, so skip copying UV/color/custom data
+    # layers into the temporary mesh.
+    mesh_eval: bt.Mesh = obj_eval.to_mesh(preserve_all_data_layers=False, depsgraph=depsgraph)
 
     try:
-        verts: int = len(mesh_eval.vertices)
-        edges: int = len(mesh_eval.edges)
-        polys: int = len(mesh_eval.polygons)
-
-        # Tri count always two less than vertex count per polygon
-        tri_count: int = sum(len(p.vertices) - 2 for p in mesh_eval.polygons)
-        return {
-            "vertices": verts,
-            "edges": edges,
-            "faces": polys,
-            "triangles": tri_count,
-        }
+        stats = _count_mesh_stats(mesh_eval)
     finally:
         obj_eval.to_mesh_clear()
 
+    _stats_cache[key] = stats
+    return stats
 
-def _get_shader_connected_to_output(mat: bt.Material):
-    """Returns Principled BSDF node.
-    
-    Currently returns first found Principled BSDF node
-    
-    TODO Check if Principled BSDF node is connected to output node. Return nothing if not or doesn't exist.
+
+def _get_shader_connected_to_output(mat: bt.Material) -> bt.Node | None:
+    """Returns the Principled BSDF node feeding the material output.
+
+    Follows the active output node's Surface link instead of scanning
+    every node in the tree. Returns None when there is no output node or
+    the connected shader isn't a Principled BSDF.
     """
 
     tree = mat.node_tree
     assert tree is not None
 
-    shader = next((n for n in tree.nodes if n.type == "BSDF_PRINCIPLED"))
-    return shader
+    out = next((n for n in tree.nodes if n.type == "OUTPUT_MATERIAL" and n.is_active_output), None)
+    if out is None:
+        return None
+
+    links = out.inputs["Surface"].links
+    shader = links[0].from_node if links else None
+    return shader if shader is not None and shader.type == "BSDF_PRINCIPLED" else None
 
 
-def _classify_shader_input(sock: bt.NodeSocket) -> dict[str, Any]:
+def _image_slot(image: bt.Image, img_cache: dict[int, dict[str, Any]], *,
+                _abspath=bpy.path.abspath,
+                _normalize=naming.normalize_texture_name) -> dict[str, Any]:
+    """Texture slot data for an image datablock, cached per pointer.
+
+    Materials routinely share one image across several sockets; caching
+    means the abspath resolution and name normalization run once per
+    image rather than once per socket. Returns a copy so callers can
+    add fields without poisoning the cache.
+    """
+
+    key = image.as_pointer()
+    cached = img_cache.get(key)
+    if cached is None:
+        colorspace = image.colorspace_settings
+        assert colorspace is not None
+
+        cached = {
+            "type": "texture",
+            "path": _abspath(image.filepath),
+            "original_name": image.name_full,
+            "normalized_name": _normalize(image.name),
+            "color_space": colorspace.name
+        }
+        img_cache[key] = cached
+
+    return dict(cached)
+
+
+def _color_val(sock: bt.NodeSocket) -> tuple[float, float, float]:
+    dv = sock.default_value
+    return (dv[0], dv[1], dv[2])
+
+
+def _float_val(sock: bt.NodeSocket) -> float:
+    return float(sock.default_value)
+
+
+# Unlinked-socket default readers keyed by exact socket type: one dict
+# lookup instead of a chain of isinstance checks.
+_SOCK_DEFAULT = {
+    bt.NodeSocketColor: _color_val,
+    bt.NodeSocketVector: _color_val,
+    bt.NodeSocketFloat: _float_val,
+    bt.NodeSocketFloatFactor: _float_val,
+}
+
+
+def _classify_shader_input(sock: bt.NodeSocket, img_cache: dict[int, dict[str, Any]], *,
+                           _TexImage=bt.ShaderNodeTexImage,
+                           _NormalMap=bt.ShaderNodeNormalMap) -> dict[str, Any]:
     """Returns material input data.
     
     Returns constant value if no nodes are used.
     If image texture is used returns image's path and color space.
     If another node is used returns 'complex' type and no other data.
+
+    The keyword-only defaults pre-bind hot globals to locals; this runs
+    six times per material.
     """
 
     if not sock.is_linked:
-        if isinstance(sock, bt.NodeSocketColor) or isinstance(sock, bt.NodeSocketVector):
-            val = list(sock.default_value)[:3]
-        elif isinstance(sock, bt.NodeSocketFloat) or isinstance(sock, bt.NodeSocketFloatFactor):
-            val = sock.default_value
+        handler = _SOCK_DEFAULT.get(type(sock))
+        val = handler(sock) if handler is not None else None
         return { "type": "constant", "value": val }
     
     links = sock.links
@@ -70,24 +210,13 @@ def _classify_shader_input(sock: bt.NodeSocket) -> dict[str, Any]:
     from_node = links[0].from_node
     assert isinstance(from_node, bt.Node)
 
-    if isinstance(from_node, bt.ShaderNodeTexImage):
+    if isinstance(from_node, _TexImage):
         image = from_node.image
         assert image is not None
 
-        new_name: str = naming.normalize_texture_name(image.name)
-
-        colorspace = image.colorspace_settings
-        assert colorspace is not None
-
-        return {
-            "type": "texture",
-            "path": bpy.path.abspath(image.filepath),
-            "original_name": image.name_full,
-            "normalized_name": new_name,
-            "color_space": colorspace.name
-        }
+        return _image_slot(image, img_cache)
     
-    if isinstance(from_node, bt.ShaderNodeNormalMap):
+    if isinstance(from_node, _NormalMap):
         color_input = from_node.inputs.get("Color")
         if color_input and color_input.is_linked:
             links = color_input.links
@@ -100,72 +229,83 @@ def _classify_shader_input(sock: bt.NodeSocket) -> dict[str, Any]:
                 image = tex_node.image
                 assert image is not None
 
-                new_name: str = naming.normalize_texture_name(image.name)
+                slot = _image_slot(image, img_cache)
+                slot["usage"] = "normal"
+                return slot
 
-                colorspace = image.colorspace_settings
-                assert colorspace is not None
+    return { "type": "complex" }
 
-                return {
-                    "type": "texture",
-                    "usage": "normal",
-                    "path": bpy.path.abspath(image.filepath),
-                    "original_name": image.name_full,
-                    "normalized_name": new_name,
-                    "color_space": colorspace.name
-                }
 
-    return { "type": "complex" }
+# Principled BSDF socket names and the manifest parameter keys they map
+# onto, in matching order.
+_PBR_INPUTS = ("Base Color", "Roughness", "Metallic", "Normal", "Emission Color", "Alpha")
+_PBR_PARAM_KEYS = ("base_color", "roughness", "metallic", "normal", "emission_color", "alpha")
 
 
 def get_material_data(obj: bt.Object) -> list[dict[str, Any]]:
     materials: list[dict[str, Any]] = []
 
+    # Scoped to this call so stale paths from renamed/repathed images
+    # can't leak between exports.
+    img_cache: dict[int, dict[str, Any]] = {}
+
     for mat in obj.material_slots:
         next_material = mat.material
         assert next_material is not None
 
         shader = _get_shader_connected_to_output(next_material)
+        if shader is None:
+            # No Principled BSDF drives the output; nothing to map onto
+            # the master material's parameters.
+            continue
 
-        base_color          = shader.inputs.get("Base Color")
-        assert base_color is not None
-        roughness           = shader.inputs.get("Roughness")
-        assert roughness is not None
-        metallic            = shader.inputs.get("Metallic")
-        assert metallic is not None
-        normal              = shader.inputs.get("Normal")
-        assert normal is not None
-        emission_color      = shader.inputs.get("Emission Color")
-        assert emission_color is not None
-        alpha               = shader.inputs.get("Alpha")
-        assert alpha is not None
+        # One walk over the BSDF's inputs instead of six collection
+        # lookups through the RNA per material; the zipped build keeps
+        # socket names and parameter keys paired by position.
+        inputs_by_name = {s.name: s for s in shader.inputs}
 
         mat_data: dict[str, Any] = { "name": next_material.name }
         mat_data["normalized_name"] = naming.normalize_material_instance_name(next_material.name)
 
-        parameters: dict[str, Any] = {}
-
-        parameters["base_color"]      = _classify_shader_input(base_color)
-        parameters["roughness"]       = _classify_shader_input(roughness)
-        parameters["metallic"]        = _classify_shader_input(metallic)
-        parameters["normal"]          = _classify_shader_input(normal)
-        parameters["emission_color"]  = _classify_shader_input(emission_color)
-        parameters["alpha"]           = _classify_shader_input(alpha)
+        parameters: dict[str, Any] = dict(zip(
+            _PBR_PARAM_KEYS,
+            (_classify_shader_input(inputs_by_name[n], img_cache) for n in _PBR_INPUTS),
+        ))
 
         mat_data["parameters"] = parameters
 
+        # Pre-flattened (name, kind, value) triples so the editor-side
+        # loop iterates directly instead of three dict gets per
+        # parameter; the dict form stays for texture metadata (names,
+        # color space) and pre-0.2.0 readers.
+        mat_data["param_list"] = [
+            [name, p["type"], p.get("path") if p["type"] == "texture" else p.get("value")]
+            for name, p in parameters.items()
+        ]
+
         materials.append(mat_data)
         
 
     return materials
 
 
+def _utc_timestamp() -> str:
+    return datetime.datetime.now(tz=datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S%z")
+
+
 def generate_metadata(obj: bt.Object, export_dir: str, ue_project_path: str, 
                       ue_assets_dir: str, material_path: str, asset_type: str, 
-                      export_ext: str, context: bt.Context) -> dict[str, Any]:
+                      export_ext: str, context: bt.Context,
+                      export_timestamp: str | None = None,
+                      include_triangles: bool = True) -> dict[str, Any]:
     """Generate export metadata for a Blender object.
 
     Builds a JSON-serializable metadata dictionary containing source
-    information, export settings, and evaluated mesh statistics.
+    information, export settings, and evaluated mesh statistics. Batch
+    callers pass export_timestamp so the whole batch shares one sampled
+    time instead of one per object. Callers that don't consume triangle
+    counts (validation budgets do) can pass include_triangles=False to
+    skip the triangulation passes and omit the keys.
     """
 
     assert obj is not None
@@ -176,45 +316,50 @@ def generate_metadata(obj: bt.Object, export_dir: str, ue_project_path: str,
     filename: str = f"{normalized_obj_name}.{export_ext}"
     export_path: str = os.path.join(export_dir, filename)
 
-    stats: dict[str, int] = get_evaluated_mesh_stats(obj, context)
+    stats: MeshStats = get_evaluated_mesh_stats(obj, context)
     
     materials: list[dict[str, Any]] = get_material_data(obj) 
 
-    return {
-        "schema": "asset_forge.export",
-        "schema_version": "0.1.0",
-        "source": {
-            "blend_file": bpy.data.filepath, 
-            "object_name": obj.name,
-            "normalized_name": normalized_obj_name,
-            "asset_type": asset_type
-        },
-        "export": {
-            "target": "unreal",
-            "format": export_ext,
-            "export_path": export_path,
-            "export_dir": export_dir,
-            "timestamp": datetime.datetime.now(tz=datetime.timezone.utc).strftime(
-                "%Y-%m-%dT:%H:%M:%SZ%z"
-            ),
-        },
-        "unreal": {
-            "unreal_project_path": ue_project_path,
-            "ue_assets_directory": ue_assets_dir,
-            "ue_master_material": material_path
-        },
-        "mesh": {
-            "name": obj.name,
-            "material_count": len(materials),
-            "stats": {
-                "original": {
-                    "vertices": len(obj_data.vertices),
-                    "edges": len(obj_data.edges),
-                    "faces": len(obj_data.polygons),
-                    "triangles": sum(len(p.vertices) - 2 for p in obj_data.polygons)
-                },
-                "evaluated": stats
-            }
-        },
-        "materials": materials
+    data: dict[str, Any] = copy.deepcopy(_META_SKELETON)
+    data["source"] = {
+        "blend_file": bpy.data.filepath,
+        "object_name": obj.name,
+        "normalized_name": normalized_obj_name,
+        "asset_type": asset_type
+    }
+    data["export"].update({
+        "format": export_ext,
+        "export_path": export_path,
+        "export_dir": export_dir,
+        "timestamp": export_timestamp if export_timestamp is not None else _utc_timestamp(),
+    })
+    data["unreal"] = {
+        "unreal_project_path": ue_project_path,
+        "ue_assets_directory": ue_assets_dir,
+        "ue_master_material": material_path
     }
+    original_stats = {
+        "vertices": len(obj_data.vertices),
+        "edges": len(obj_data.edges),
+        "faces": len(obj_data.polygons),
+    }
+    evaluated_stats = asdict(stats)
+    if include_triangles:
+        # calc_loop_triangles gives the exact count (including concave
+        # polygons) in one C pass, same as the evaluated stats.
+        obj_data.calc_loop_triangles()
+        original_stats["triangles"] = len(obj_data.loop_triangles)
+    else:
+        del evaluated_stats["triangles"]
+
+    data["mesh"] = {
+        "name": obj.name,
+        "material_count": len(materials),
+        "stats": {
+            "original": original_stats,
+            "evaluated": evaluated_stats
+        }
+    }
+    data["materials"] = materials
+
+    return data
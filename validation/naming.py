@@ -58,12 +58,6 @@ TEX_SUFFIX_ALIASES = {
 KNOWN_PREFIXES = ("sm", "m", "t", "tex", "texture", "mat", "mi", "material", "mesh", "staticmesh", "static_mesh", "geo")
 
 
-def validate_prefix(prefix: str, file_name: str) -> bool:
-    """Returns True if file name contains prefix and False if not."""
-    prefix_len: int = len(prefix)
-    return prefix == file_name[:prefix_len]
-
-
 def add_prefix_to_file(prefix: str, file_name: str) -> str:
     return prefix + file_name
 
@@ -3,92 +3,179 @@ import bpy
 from typing import Any
 from . import error_checks, warning_checks
 from . import validation_types as vt
+from .. import config
+from ..export import mesh_metadata
 
-def _build_context(obj: bpy.types.Object, asset_type: str) -> vt.ValidationContext:
-    mats = [slot.material for slot in obj.material_slots if slot.material]
-    mats = list(dict.fromkeys(mats))
+# Cached messages of the geometry-derived rules only, keyed on the
+# content hash, asset type, and the config values those rules read.
+# Everything else (UV layers, names, materials, textures) lies outside
+# the content hash and re-runs every pass so edits like adding a UV map
+# or renaming an object can't be masked by a stale hit — those rules
+# are cheap anyway.
+_validation_cache: dict[tuple, dict[str, list[str]]] = {}
 
-    images = []
-    for m in mats:
-        if not m.use_nodes or not m.node_tree:
-            continue
-        for node in m.node_tree.nodes:
-            if isinstance(node, bpy.types.ShaderNodeTexImage):
-                images.append(node.image)
+_GEOMETRY_CODES = frozenset({"NON_MANIFOLD", "MESH_NOT_MODULAR", "OVER_TRIANGLE_BUDGET"})
+
+
+# Rules are immutable, so the set is built once at import instead of
+# re-allocating eight dataclass instances per validated asset. Error
+# rules run cheapest-first (UV layer presence, then precomputed bounds,
+# then the bmesh manifold walk) so fail_fast callers exit early.
+_RULES: tuple[vt.ValidationRule, ...] = (
+    vt.ValidationRule(
+        code="MISSING_UV",
+        severity="error",
+        check=error_checks.validate_mesh_uv # type: ignore
+    ),
+    vt.ValidationRule(
+        code="MESH_NOT_MODULAR",
+        severity="error",
+        check=error_checks.validate_modular # type: ignore
+    ),
+    vt.ValidationRule(
+        code="NON_MANIFOLD",
+        severity="error",
+        check=error_checks.validate_mesh_manifold # type: ignore
+    ),
+    vt.ValidationRule(
+        code="MISSING_MATERIALS",
+        severity="warning",
+        check=warning_checks.validate_mesh_materials # type: ignore
+    ),
+    vt.ValidationRule(
+        code="BAD_NAME",
+        severity="warning",
+        check=warning_checks.validate_file_names # type: ignore
+    ),
+    vt.ValidationRule(
+        code="OVER_TRIANGLE_BUDGET",
+        severity="warning",
+        check=warning_checks.validate_triangle_budget # type: ignore
+    ),
+)
+
+
+def _build_context(obj: bpy.types.Object, asset_type: str,
+                   need_bounds: bool = True) -> vt.ValidationContext:
+    # dict.fromkeys over a generator dedupes while collecting — no
+    # intermediate list and one pass per collection.
+    mats = list(dict.fromkeys(
+        slot.material for slot in obj.material_slots if slot.material
+    ))
 
-    images = list(dict.fromkeys(images))
+    images = list(dict.fromkeys(
+        node.image
+        for m in mats if m.use_nodes and m.node_tree
+        for node in m.node_tree.nodes
+        if isinstance(node, bpy.types.ShaderNodeTexImage) and node.image
+    ))
 
-    return vt.ValidationContext(obj, asset_type, mats, images)
+    # One evaluated-mesh pass feeds every rule: stats come from the
+    # depsgraph-cached helper and bounds are only computed when the
+    # modular rule will read them.
+    evaluated_stats = None
+    mesh_data = None
+    if obj.type == "MESH":
+        evaluated_stats = mesh_metadata.get_evaluated_mesh_stats(obj, bpy.context)
+        assert isinstance(obj.data, bpy.types.Mesh)
+        mesh_data = obj.data
 
+    bounds = None
+    if need_bounds and asset_type == "MODULAR":
+        bounds = error_checks._eval_object_bounds_local(obj)
 
-def generate_validation_data(obj: bpy.types.Object, asset_type: str) -> dict[str, Any]:
+    return vt.ValidationContext(obj, asset_type, mats, images,
+                                mesh_data=mesh_data,
+                                evaluated_stats=evaluated_stats,
+                                bounds=bounds)
+
+
+def generate_validation_data(obj: bpy.types.Object, asset_type: str,
+                             content_hash: str | None = None,
+                             fail_fast: bool = False) -> dict[str, Any]:
     """Validates mesh and returns any errors or warnings.
-    
+
     Mesh can pass with warnings but will fail to pass if any errors are found.
+
+    When the caller supplies the mesh content hash, the geometry-derived
+    rules (manifoldness, modular grid, triangle budget) are cached per
+    (hash, asset type, budgets) so unchanged meshes skip the expensive
+    scans; the cheap rules still run because their inputs aren't covered
+    by the hash. With fail_fast, validation stops at the first error —
+    useful for callers that only gate on passed — and the truncated
+    geometry results are not cached.
     """
 
-    obj_data: vt.ValidationContext = _build_context(obj, asset_type)
-
-    rules: list[vt.ValidationRule] = [
-        vt.ValidationRule(
-            code="MISSING_UV",
-            severity="error",
-            check=error_checks.validate_mesh_uv # type: ignore
-        ),
-        vt.ValidationRule(
-            code="NON_MANIFOLD",
-            severity="error",
-            check=error_checks.validate_mesh_manifold # type: ignore
-        ),
-        vt.ValidationRule(
-            code="MISSING_MATERIALS",
-            severity="warning",
-            check=warning_checks.validate_mesh_materials # type: ignore
-        ),
-        vt.ValidationRule(
-            code="BAD_NAME",
-            severity="warning",
-            check=warning_checks.validate_file_names # type: ignore
-        ),
-        vt.ValidationRule(
-            code="OVER_TRIANGLE_BUDGET",
-            severity="warning",
-            check=warning_checks.validate_triangle_budget # type: ignore
-        ),
-        vt.ValidationRule(
-            code="TEXTURE_NOT_SQUARE",
-            severity="warning",
-            check=warning_checks.validate_texture_aspect_ratio # type: ignore
-        ),
-        vt.ValidationRule(
-            code="OVER_TEXTURE_BUDGET",
-            severity="warning",
-            check=warning_checks.validate_texture_size # type: ignore
-        ),
-        vt.ValidationRule(
-            code="MESH_NOT_MODULAR",
-            severity="error",
-            check=error_checks.validate_modular # type: ignore
-        ),
-    ]
+    # One type check here instead of a prologue in every rule; non-mesh
+    # assets skip context building and the rule loop entirely.
+    if obj.type != "MESH":
+        return {
+            "passed": False,
+            "errors": [{"code": "NOT_MESH", "message": ["Asset is not a mesh."]}],
+            "warnings": [],
+        }
+
+    cache_key = None
+    geometry_cached = None
+    if content_hash is not None:
+        cache_key = (
+            content_hash,
+            asset_type,
+            config.get_setting("modular_mesh_units.unit", 0.1),
+            config.get_setting("modular_mesh_units.eps", 1e-5),
+            config.get_setting(f"asset_budgets.{asset_type}.max_triangles", None),
+        )
+        geometry_cached = _validation_cache.get(cache_key)
+
+    # Bounds only feed the modular rule, which a geometry-cache hit
+    # skips — don't re-run the evaluated-mesh pass just to discard it.
+    obj_data: vt.ValidationContext = _build_context(
+        obj, asset_type, need_bounds=geometry_cached is None)
 
     error_items: list[dict[str, Any]] = []
     warning_items: list[dict[str, Any]] = []
+    new_geometry: dict[str, list[str]] = {}
 
-    for r in rules:
-        message = r.check(obj_data) # type: ignore
-        if message == []:
+    for r in _RULES:
+        if r.code in _GEOMETRY_CODES and geometry_cached is not None:
+            message = geometry_cached.get(r.code, [])
+        else:
+            message = r.check(obj_data) # type: ignore
+            if r.code in _GEOMETRY_CODES:
+                new_geometry[r.code] = message
+
+        if not message:
             continue
 
         item = {"code": r.code, "message": message}
         if r.severity == "error":
             error_items.append(item)
+            if fail_fast:
+                break
         else:
             warning_items.append(item)
 
-    return {
+    # The per-image checks (texture naming, aspect ratio, size budget)
+    # run fused in one traversal and merge into the rule results by code.
+    by_code = {item["code"]: item for item in warning_items}
+    for code, messages in warning_checks.validate_images(obj_data).items():
+        if not messages:
+            continue
+
+        item = by_code.get(code)
+        if item is not None:
+            item["message"].extend(messages)
+        else:
+            warning_items.append({"code": code, "message": messages})
+
+    result = {
         "passed": len(error_items) == 0,
         "errors": error_items,
         "warnings": warning_items,
     }
-    
+    # A fail-fast break may have skipped geometry rules, so only a full
+    # pass populates the cache.
+    if cache_key is not None and geometry_cached is None and not (fail_fast and error_items):
+        _validation_cache[cache_key] = new_geometry
+    return result
+
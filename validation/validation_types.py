@@ -1,18 +1,27 @@
 import bpy
 
-from typing import Callable, Literal
+from typing import Any, Callable, Literal
 from dataclasses import dataclass
+from mathutils import Vector
 
 Severity = Literal["error", "warning"]
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ValidationContext:
     obj: bpy.types.Object
     obj_type: str
     materials: list[bpy.types.Material]
     images: list[bpy.types.Image]
+    # The object's mesh datablock, resolved and type-checked once in
+    # _build_context instead of per rule.
+    mesh_data: bpy.types.Mesh | None = None
+    # Shared evaluated-mesh products, computed once in _build_context so
+    # individual rules don't each re-run the modifier stack. stats is a
+    # mesh_metadata.MeshStats; bounds is only filled for modular assets.
+    evaluated_stats: Any = None
+    bounds: tuple[Vector, Vector] | None = None
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ValidationRule:
     code: str
     severity: Severity
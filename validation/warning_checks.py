@@ -1,50 +1,11 @@
-import bpy
-
-from typing import Any
-
-from . import naming
 from . import validation_types as vt
 from .. import config
 
-def _get_evaluated_mesh_stats(obj: bpy.types.Object, context: bpy.types.Context) -> dict[str, int]:
-    """Return mesh statistics after all modifiers are evaluated.
-
-    A temporary evaluated mesh is created to compute statistics and is
-    cleared before returning.
-    """
-
-    depsgraph: Any = context.evaluated_depsgraph_get()
-    obj_eval: bpy.types.Object = obj.evaluated_get(depsgraph)
-
-    mesh_eval: bpy.types.Mesh = obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
-
-    try:
-        verts: int = len(mesh_eval.vertices)
-        edges: int = len(mesh_eval.edges)
-        polys: int = len(mesh_eval.polygons)
-
-        # Tri count always two less than vertex count per polygon
-        tri_count: int = sum(len(p.vertices) - 2 for p in mesh_eval.polygons)
-        return {
-            "vertices": verts,
-            "edges": edges,
-            "faces": polys,
-            "triangles": tri_count,
-        }
-    finally:
-        obj_eval.to_mesh_clear()
-
-
 def validate_mesh_materials(validation_data: vt.ValidationContext) -> list[str]:
     """Return true if object has materials"""
 
-    obj = validation_data.obj
-    
-    if obj.type != "MESH":
-        return ["Error validating materials. Asset is not a mesh."]
-   
-    data = obj.data
-    assert isinstance(data, bpy.types.Mesh)
+    data = validation_data.mesh_data
+    assert data is not None
 
     if bool(data.materials):
         return[]
@@ -55,53 +16,67 @@ def validate_mesh_materials(validation_data: vt.ValidationContext) -> list[str]:
 def validate_file_names(validation_data: vt.ValidationContext) -> list[str]:
     messages: list[str] = []
 
-    if not naming.validate_prefix(config.get_setting("naming_conventions.mesh_prefix", "SM_"), validation_data.obj.name):
-        messages.append(f"Static mesh {validation_data.obj.name} does not start with the required prefix '{config.get_setting("naming_conventions.mesh_prefix", "SM_")}'")
+    # One lookup per prefix instead of one per check plus one per
+    # message; the same local feeds both. Texture names are covered by
+    # validate_images' fused pass.
+    mesh_prefix = config.get_setting("naming_conventions.mesh_prefix", "SM_")
+    mat_prefix = config.get_setting("naming_conventions.material_instance_prefix", "MI_")
+
+    # str.startswith beats the slice-and-compare wrapper in naming and
+    # saves a Python frame per name.
+    if not validation_data.obj.name.startswith(mesh_prefix):
+        messages.append(f"Static mesh {validation_data.obj.name} does not start with the required prefix '{mesh_prefix}'")
 
-    for image in validation_data.images:
-        if not naming.validate_prefix(config.get_setting("naming_conventions.texture_prefix", "T_"), image.name):
-            messages.append(f"Texture {image.name_full} does not start with the required prefix '{config.get_setting("naming_conventions.texture_prefix", "T_")}'")
-    
     for mat in validation_data.materials:
-        if not naming.validate_prefix(config.get_setting("naming_conventions.material_instance_prefix", "MI_"), mat.name):
-            messages.append(f"Material {mat.name} does not start with the required prefix '{config.get_setting("naming_conventions.material_instance_prefix", "MI_")}'")
+        if not mat.name.startswith(mat_prefix):
+            messages.append(f"Material {mat.name} does not start with the required prefix '{mat_prefix}'")
     return messages
 
 
 def validate_triangle_budget(validation_data: vt.ValidationContext) -> list[str]:
-    if validation_data.obj.type != "MESH":
-        return ["Error validating triangle budget. Asset is not a mesh."]
-
-    data = validation_data.obj.data
-    assert isinstance(data, bpy.types.Mesh)
-
-    evalutaed_stats: dict[str, Any] = _get_evaluated_mesh_stats(validation_data.obj, bpy.context)
+    stats = validation_data.evaluated_stats
+    assert stats is not None
 
     budget = config.get_setting(f"asset_budgets.{validation_data.obj_type}.max_triangles", None)
     assert budget is not None, f"No triangle budget set for asset type {validation_data.obj_type}"
 
-    if evalutaed_stats["triangles"] > budget:
-        return [f"Mesh has {evalutaed_stats['triangles']} triangles, which exceeds the budget of {budget} for asset type {validation_data.obj_type}."]
+    if stats.triangles > budget:
+        return [f"Mesh has {stats.triangles} triangles, which exceeds the budget of {budget} for asset type {validation_data.obj_type}."]
 
     return []
 
 
-def validate_texture_aspect_ratio(validation_data: vt.ValidationContext) -> list[str]:
-    messages: list[str] = []
+def validate_images(validation_data: vt.ValidationContext) -> dict[str, list[str]]:
+    """Run every per-image check in one traversal, keyed by rule code.
 
-    for image in validation_data.images:
-        if image.size[0] != image.size[1]:
-            messages.append(f"Image texture {image.name_full} does not have a square aspect ratio. {image.name_full} aspect ratio is {image.size[0] / image.size[1]}.")
-
-    return messages
+    Visiting each image once reads its RNA attributes (name, size) a
+    single time for all three checks instead of once per rule.
+    """
 
+    bad_names: list[str] = []
+    not_square: list[str] = []
+    over_budget: list[str] = []
 
-def validate_texture_size(validation_data: vt.ValidationContext) -> list[str]:
-    messages: list[str] = []
+    tex_prefix = config.get_setting("naming_conventions.texture_prefix", "T_")
     budget: int = config.get_setting(f"asset_budgets.{validation_data.obj_type}.max_texture_size")
 
     for image in validation_data.images:
-        if image.size[0] > budget:
-            messages.append(f"Image texture {image.name_full} has size of {image.size[0]}px, which exceeds the budget of {budget}px for asset type {validation_data.obj_type}.")
+        name_full = image.name_full
+        # One RNA read of size per image; the h != 0 guard covers
+        # packed/missing images, which report 0x0.
+        w, h = image.size[0], image.size[1]
 
-    return messages
+        if not image.name.startswith(tex_prefix):
+            bad_names.append(f"Texture {name_full} does not start with the required prefix '{tex_prefix}'")
+
+        if w != h and h != 0:
+            not_square.append(f"Image texture {name_full} does not have a square aspect ratio. {name_full} aspect ratio is {w / h}.")
+
+        if w > budget:
+            over_budget.append(f"Image texture {name_full} has size of {w}px, which exceeds the budget of {budget}px for asset type {validation_data.obj_type}.")
+
+    return {
+        "BAD_NAME": bad_names,
+        "TEXTURE_NOT_SQUARE": not_square,
+        "OVER_TEXTURE_BUDGET": over_budget,
+    }